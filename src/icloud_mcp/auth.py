@@ -3,7 +3,11 @@
 from typing import Tuple, Optional
 from fastmcp import Context
 from fastmcp.server.dependencies import get_http_headers
-from .config import config
+from .config import FALLBACK_EMAIL, FALLBACK_PASSWORD
+
+# Header names as normalized by FastMCP/ASGI (always lowercase)
+_HEADER_EMAIL = "x-apple-email"
+_HEADER_PASSWORD = "x-apple-app-specific-password"
 
 
 class AuthenticationError(Exception):
@@ -18,19 +22,19 @@ def get_credentials(context: Context) -> Tuple[str, str]:
     headers = get_http_headers()
     print(f"[AUTH DEBUG] Headers retrieved: {list(headers.keys())}")
     
-    # Extract credentials from headers
-    email: Optional[str] = headers.get("x-apple-email") or headers.get("X-Apple-Email")
-    password: Optional[str] = headers.get("x-apple-app-specific-password") or headers.get("X-Apple-App-Specific-Password")
+    # Extract credentials from headers (keys are already lowercased)
+    email: Optional[str] = headers.get(_HEADER_EMAIL)
+    password: Optional[str] = headers.get(_HEADER_PASSWORD)
     
     print(f"[AUTH DEBUG] Email from headers: {email}")
     print(f"[AUTH DEBUG] Password from headers: {'***' if password else None}")
     
     # Fallback to environment variables
     if not email:
-        email = config.FALLBACK_EMAIL
+        email = FALLBACK_EMAIL
         print(f"[AUTH DEBUG] Using fallback email: {email}")
     if not password:
-        password = config.FALLBACK_PASSWORD
+        password = FALLBACK_PASSWORD
         print(f"[AUTH DEBUG] Using fallback password: {'***' if password else None}")
 
     # Validate credentials
@@ -1,24 +1,995 @@
 """CalDAV tools for calendar management."""
 
+import asyncio
 import caldav
+import contextvars
+import functools
+import icalendar
+import io
+import logging
+import re
+import recurring_ical_events
 import smtplib
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-from urllib.parse import urlparse
+import threading
+import time
+import uuid
+import requests
+import vobject
+from caldav.lib.error import AuthorizationError, NotFoundError, ReportError
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Any, Optional, Tuple, Callable, Iterator, AsyncIterator, TypeVar
+from urllib.parse import urlparse, urljoin, unquote
+from xml.sax.saxutils import escape as xml_escape
+from zoneinfo import ZoneInfo
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from fastmcp import Context
 from .auth import require_auth
-from .config import config
+from .config import CALDAV_SERVER, SENT_FOLDER, SMTP_PORT, SMTP_SERVER
+from .dav import (
+    MAX_CONCURRENT_REQUESTS, TAG_GETETAG, TAG_HREF, UNSUPPORTED_QUERY_STATUSES,
+    SessionCache, credentials_key, iter_responses
+)
+
+
+T = TypeVar("T")
+
+# Maximum number of credential pairs with a cached CalDAV client
+_DAV_CACHE_SIZE = 32
+
+# Errors after which a cached client is dropped and rebuilt once
+_DAV_RETRY_ERRORS = (AuthorizationError, requests.exceptions.ConnectionError)
+
+# Worker threads for blocking CalDAV/SMTP calls made from async tools
+_MAX_WORKER_THREADS = 16
+
+
+@dataclass
+class _PendingWrite:
+    """A queued PUT/DELETE and the future its caller is waiting on."""
+    method: str
+    url: str
+    kwargs: Dict[str, Any]
+    future: asyncio.Future
+
+
+@dataclass
+class CachedDav:
+    """CalDAV client, its discovered principal and calendar list, reused across tool calls."""
+    client: caldav.DAVClient
+    principal: caldav.Principal
+    created_at: float = field(default_factory=time.monotonic)
+    # (fetched_at, calendars); calendars are bound to this entry's client
+    calendars: Optional[Tuple[float, List[caldav.Calendar]]] = None
+
+
+# Top-level VEVENT properties extracted by the ICS line scanner
+_VEVENT_PROPERTIES = frozenset(("SUMMARY", "DESCRIPTION", "LOCATION", "DTSTART", "DTEND", "TRANSP"))
+
+# Characters written escaped in ICS TEXT values
+_ICS_CHARS_NEEDING_ESCAPE = frozenset("\\;,\n")
+
+# Decodes RFC 5545 TEXT escapes (backslash, semicolon, comma and newline)
+_ICS_TEXT_UNESCAPE_RE = re.compile(r"\\([\\;,nN])")
+
+# Encodes RFC 5545 TEXT escapes, applied with str.translate
+_ICS_TEXT_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", ",": "\\,", ";": "\\;", "\n": "\\n", "\r": ""})
+
+# Writes to the same calendar are coalesced for up to this many seconds...
+_WRITE_BATCH_WINDOW = 0.025
+
+# ...or until this many are queued, then dispatched together
+_WRITE_BATCH_SIZE = 16
+
+# Static parts of the VCALENDAR body written by create_event
+_ICS_PREFIX = (
+    b"BEGIN:VCALENDAR\r\n"
+    b"VERSION:2.0\r\n"
+    b"PRODID:-//iCloud MCP//EN\r\n"
+    b"CALSCALE:GREGORIAN\r\n"
+    b"BEGIN:VEVENT\r\n"
+)
+_ICS_SUFFIX = b"STATUS:CONFIRMED\r\nSEQUENCE:0\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n"
+
+# Seconds a cached calendar list stays fresh
+_CALENDARS_TTL = 300
+
+# Date ranges wider than this are searched in parallel windows of _DATE_WINDOW
+_DATE_WINDOW_THRESHOLD = timedelta(days=60)
+_DATE_WINDOW = timedelta(days=30)
+
+# Event properties matched by search_events
+_SEARCH_PROPERTIES = ("SUMMARY", "DESCRIPTION", "LOCATION")
+
+# Clark-notation tag of calendar data in a CalDAV multistatus response
+_TAG_CALENDAR_DATA = "{urn:ietf:params:xml:ns:caldav}calendar-data"
+
+# Maximum number of event bodies kept for conditional GETs
+_EVENT_CACHE_SIZE = 2048
+
+# Dedicated pool for blocking I/O; FastMCP owns the event loop and its default executor
+_executor = ThreadPoolExecutor(max_workers=_MAX_WORKER_THREADS, thread_name_prefix="icloud-mcp")
+
+_dav_cache: "OrderedDict[Tuple[str, str], CachedDav]" = OrderedDict()
+_dav_cache_lock = threading.Lock()
+
+# Plain HTTP sessions with Basic auth preloaded, per credential pair
+_http_sessions = SessionCache(
+    {"User-Agent": "iCloud-MCP/1.0"}, pool_maxsize=8, max_size=_DAV_CACHE_SIZE
+)
+
+# Pending writes per (email, password hash, calendar collection URL)
+_write_queues: Dict[Tuple[str, str, str], "asyncio.Queue[_PendingWrite]"] = {}
+_write_workers: set = set()
+
+# Event bodies by unquoted URL: (etag, iCalendar data), revalidated with If-None-Match
+_event_cache: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+_event_cache_lock = threading.Lock()
 
 
 def _get_caldav_client(email: str, password: str) -> caldav.DAVClient:
-    """Create CalDAV client (stateless)."""
-    return caldav.DAVClient(
-        url=config.CALDAV_SERVER,
+    """Create CalDAV client with a keep-alive connection pool."""
+    client = caldav.DAVClient(
+        url=CALDAV_SERVER,
         username=email,
         password=password
     )
+    # Reuse TCP/TLS connections between requests instead of reconnecting
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+    client.session.mount("https://", adapter)
+    return client
+
+
+def _get_cached_dav(email: str, password: str) -> CachedDav:
+    """
+    Get the cached CalDAV client and principal for these credentials.
+
+    The client and principal (which costs several PROPFIND round-trips to
+    discover) are created once per credential pair and kept for the process
+    lifetime, least recently used entries are dropped past _DAV_CACHE_SIZE.
+    """
+    key = credentials_key(email, password)
+    with _dav_cache_lock:
+        dav = _dav_cache.get(key)
+        if dav is not None:
+            _dav_cache.move_to_end(key)
+            return dav
+
+    client = _get_caldav_client(email, password)
+    dav = CachedDav(client=client, principal=client.principal())
+
+    with _dav_cache_lock:
+        _dav_cache[key] = dav
+        _dav_cache.move_to_end(key)
+        while len(_dav_cache) > _DAV_CACHE_SIZE:
+            _dav_cache.popitem(last=False)
+    return dav
+
+
+def _evict_cached_dav(email: str, password: str) -> None:
+    """Drop the cached CalDAV client (and calendar list) for these credentials."""
+    key = credentials_key(email, password)
+    with _dav_cache_lock:
+        _dav_cache.pop(key, None)
+
+
+def _evict_dav_client(client: caldav.DAVClient) -> None:
+    """Drop the cached CalDAV entry (and calendar list) built on this client."""
+    with _dav_cache_lock:
+        keys = [key for key, dav in _dav_cache.items() if dav.client is client]
+        for key in keys:
+            del _dav_cache[key]
+
+
+def _is_dav_retry_error(error: BaseException) -> bool:
+    """Check whether an error means cached credentials or connections went bad."""
+    if isinstance(error, _DAV_RETRY_ERRORS):
+        return True
+    response = getattr(error, "response", None)
+    return response is not None and response.status_code == 401
+
+
+def _get_http_session(email: str, password: str) -> requests.Session:
+    """Get a pooled HTTP session for these credentials."""
+    return _http_sessions.get(email, password)
+
+
+def _raw_request(email: str, password: str, method: str, url: str, **kwargs: Any) -> requests.Response:
+    """
+    Send an authenticated request straight to a CalDAV URL.
+
+    Skips principal discovery entirely, for operations that already know the
+    absolute URL. Raises requests.HTTPError on error statuses.
+    """
+    response = _get_http_session(email, password).request(method, url, **kwargs)
+    response.raise_for_status()
+    return response
+
+
+async def _to_thread(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking call on the module's worker pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await loop.run_in_executor(_executor, call)
+
+
+def _remember_event(url: str, etag: str, data: str) -> None:
+    """Cache an event body under its ETag for later conditional GETs."""
+    if not etag:
+        _forget_event(url)
+        return
+    key = unquote(url)
+    with _event_cache_lock:
+        _event_cache[key] = (etag, data)
+        _event_cache.move_to_end(key)
+        while len(_event_cache) > _EVENT_CACHE_SIZE:
+            _event_cache.popitem(last=False)
+
+
+def _forget_event(url: str) -> None:
+    """Drop a cached event body."""
+    with _event_cache_lock:
+        _event_cache.pop(unquote(url), None)
+
+
+def _get_event(email: str, password: str, url: str) -> Tuple[str, str]:
+    """
+    Load an event's (etag, iCalendar data) by URL.
+
+    A cached copy is revalidated with If-None-Match, so an unchanged event
+    costs a bodiless 304 instead of a full download.
+    """
+    with _event_cache_lock:
+        cached = _event_cache.get(unquote(url))
+    headers = {"If-None-Match": cached[0]} if cached else {}
+
+    response = _raw_request(email, password, "GET", url, headers=headers)
+    if response.status_code == 304 and cached:
+        with _event_cache_lock:
+            if unquote(url) in _event_cache:
+                _event_cache.move_to_end(unquote(url))
+        return cached
+
+    etag = response.headers.get("ETag", "")
+    data = response.content.decode("utf-8")
+    _remember_event(url, etag, data)
+    return etag, data
+
+
+async def _drain_writes(
+    key: Tuple[str, str, str],
+    email: str,
+    password: str,
+    queue: "asyncio.Queue[_PendingWrite]"
+) -> None:
+    """
+    Dispatch queued writes for one calendar collection in batches.
+
+    Each batch collects writes for _WRITE_BATCH_WINDOW seconds (or until
+    _WRITE_BATCH_SIZE are queued) and sends them in parallel over the shared
+    keep-alive session. The worker exits once its queue is empty.
+    """
+    loop = asyncio.get_running_loop()
+    while not queue.empty():
+        batch = [queue.get_nowait()]
+        deadline = loop.time() + _WRITE_BATCH_WINDOW
+        while len(batch) < _WRITE_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        responses = await asyncio.gather(
+            *(_to_thread(_raw_request, email, password, write.method, write.url, **write.kwargs)
+              for write in batch),
+            return_exceptions=True
+        )
+        for write, response in zip(batch, responses):
+            if write.future.done():
+                # Caller went away (cancelled)
+                continue
+            if isinstance(response, BaseException):
+                write.future.set_exception(response)
+            else:
+                write.future.set_result(response)
+
+    del _write_queues[key]
+
+
+async def _queue_write(email: str, password: str, method: str, url: str, **kwargs: Any) -> requests.Response:
+    """
+    Queue a PUT/DELETE for batched dispatch and wait for its own response.
+
+    Concurrent writes to the same calendar share one coalescing worker
+    instead of each paying a separate round-trip.
+    """
+    collection_url = url.rsplit("/", 1)[0] + "/"
+    key = (*credentials_key(email, password), collection_url)
+
+    queue = _write_queues.get(key)
+    if queue is None:
+        queue = asyncio.Queue()
+        _write_queues[key] = queue
+        worker = asyncio.create_task(_drain_writes(key, email, password, queue))
+        _write_workers.add(worker)
+        worker.add_done_callback(_write_workers.discard)
+
+    future = asyncio.get_running_loop().create_future()
+    queue.put_nowait(_PendingWrite(method, url, kwargs, future))
+    return await future
+
+
+def _with_dav(email: str, password: str, operation: Callable[[CachedDav], T]) -> T:
+    """
+    Run an operation against the cached CalDAV client.
+
+    On authorization or connection errors the cached entry is evicted and
+    the operation is retried once with a freshly discovered client.
+    """
+    try:
+        return operation(_get_cached_dav(email, password))
+    except _DAV_RETRY_ERRORS:
+        _evict_cached_dav(email, password)
+        return operation(_get_cached_dav(email, password))
+
+
+def _get_calendars(email: str, password: str) -> List[caldav.Calendar]:
+    """
+    Get the account's calendars, cached for _CALENDARS_TTL seconds.
+
+    Calendars change at human timescales, so this avoids a PROPFIND on the
+    calendar home for every tool call.
+    """
+    def list_calendars(dav: CachedDav) -> List[caldav.Calendar]:
+        cached = dav.calendars
+        if cached is not None and time.monotonic() - cached[0] < _CALENDARS_TTL:
+            return cached[1]
+        calendars = dav.principal.calendars()
+        dav.calendars = (time.monotonic(), calendars)
+        return calendars
+
+    return _with_dav(email, password, list_calendars)
+
+
+def _is_stale_calendar_error(error: BaseException) -> bool:
+    """Check whether an error means a calendar URL no longer exists (404/410)."""
+    if isinstance(error, NotFoundError):
+        return True
+    response = getattr(error, "response", None)
+    return response is not None and response.status_code in (404, 410)
+
+
+def _forget_calendar(calendar_url: str) -> None:
+    """Invalidate cached calendar lists that contain a stale calendar URL."""
+    with _dav_cache_lock:
+        entries = list(_dav_cache.values())
+    for dav in entries:
+        cached = dav.calendars
+        if cached is not None and any(str(calendar.url) == calendar_url for calendar in cached[1]):
+            dav.calendars = None
+
+
+def _join_ics_folds(data: str) -> str:
+    """Join RFC 5545 continuation lines back onto the line they continue."""
+    return (
+        data.replace("\r\n ", "").replace("\r\n\t", "")
+        .replace("\n ", "").replace("\n\t", "")
+    )
+
+
+def _unfold_ics(data: str) -> List[str]:
+    """Split ICS text into logical lines, joining RFC 5545 continuation lines."""
+    return _join_ics_folds(data).splitlines()
+
+
+def _split_ics_line(line: str) -> Tuple[str, str, str]:
+    """Split a content line into (NAME, params, value)."""
+    colon = line.find(":")
+    if colon < 0:
+        return line.upper(), "", ""
+
+    # Quoted parameter values (e.g. ALTREP="cid:...") may contain colons
+    if '"' in line[:colon]:
+        in_quotes = False
+        for i, char in enumerate(line):
+            if char == '"':
+                in_quotes = not in_quotes
+            elif char == ":" and not in_quotes:
+                colon = i
+                break
+
+    name, _, params = line[:colon].partition(";")
+    return name.upper(), params, line[colon + 1:]
+
+
+def _scan_vevents(data: str) -> Iterator[Dict[str, Tuple[str, str]]]:
+    """
+    Scan raw ICS text for VEVENT components.
+
+    Yields {NAME: (params, value)} with the first occurrence of each property
+    in _VEVENT_PROPERTIES. Properties of nested components (VALARM) and other
+    components (VTIMEZONE, VTODO) are skipped.
+    """
+    props = None
+    depth = 0
+    for line in _unfold_ics(data):
+        if props is None:
+            if line.upper() == "BEGIN:VEVENT":
+                props = {}
+                depth = 0
+            continue
+
+        upper = line[:6].upper()
+        if upper == "BEGIN:":
+            depth += 1
+        elif upper.startswith("END:"):
+            if depth:
+                depth -= 1
+            else:
+                yield props
+                props = None
+        elif not depth:
+            name, params, value = _split_ics_line(line)
+            if name in _VEVENT_PROPERTIES and name not in props:
+                props[name] = (params, value)
+
+
+def _expand_recurrences(data: str, start: datetime, end: datetime) -> str:
+    """
+    Expand recurring VEVENTs of an iCalendar object into their instances in a range.
+
+    Servers may ignore <C:expand> (caldav flags iCloud as such) and return
+    the master event with its original DTSTART; this expands on the client
+    like caldav's expand_rrule does for date_search.
+    """
+    if "RRULE" not in data and "RDATE" not in data:
+        return data
+    try:
+        instances = recurring_ical_events.of(icalendar.Calendar.from_ical(data)).between(start, end)
+    except Exception:
+        # Leave unparseable data to the ICS scanner
+        return data
+
+    expanded = icalendar.Calendar()
+    for instance in instances:
+        if "RECURRENCE-ID" not in instance:
+            instance.add("RECURRENCE-ID", instance.get("DTSTART").dt)
+        expanded.add_component(instance)
+    return expanded.to_ical().decode("utf-8")
+
+
+def _ics_text(prop: Optional[Tuple[str, str]]) -> str:
+    """Decode an ICS TEXT property value."""
+    if prop is None:
+        return ""
+    value = prop[1]
+    if "\\" not in value:
+        return value
+    return _ICS_TEXT_UNESCAPE_RE.sub(
+        lambda match: "\n" if match.group(1) in "nN" else match.group(1),
+        value
+    )
+
+
+def _ics_datetime(prop: Optional[Tuple[str, str]]) -> Optional[str]:
+    """Convert an ICS DATE or DATE-TIME property to an ISO string."""
+    if prop is None:
+        return None
+    params, value = prop
+    value = value.strip()
+
+    try:
+        if len(value) == 8:  # DATE: YYYYMMDD
+            return date(int(value[:4]), int(value[4:6]), int(value[6:8])).isoformat()
+
+        dt = datetime(
+            int(value[:4]), int(value[4:6]), int(value[6:8]),
+            int(value[9:11]), int(value[11:13]), int(value[13:15])
+        )
+    except ValueError:
+        return value
+
+    if value.endswith("Z"):
+        return dt.replace(tzinfo=timezone.utc).isoformat()
+
+    for param in params.split(";"):
+        if param[:5].upper() == "TZID=":
+            try:
+                dt = dt.replace(tzinfo=ZoneInfo(param[5:].strip('"')))
+            except (ValueError, KeyError, OSError):
+                # Non-Olson TZID: keep the floating local time
+                pass
+            break
+
+    return dt.isoformat()
+
+
+def _parse_date_range(
+    start_date: Optional[str],
+    end_date: Optional[str]
+) -> Tuple[datetime, datetime]:
+    """
+    Parse an ISO date range, defaulting to 90 days back and 365 days ahead.
+
+    Offset-aware bounds are converted to naive local time, so a range mixing
+    aware and naive (or date-only) bounds can still be compared and windowed.
+    """
+    # One clock read for both defaults
+    now = datetime.now() if not (start_date and end_date) else None
+
+    if start_date:
+        start = datetime.fromisoformat(start_date)
+        # If only date provided (no time), set to start of day
+        if len(start_date) == 10:  # Format: YYYY-MM-DD
+            start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    else:
+        start = now - timedelta(days=90)
+
+    if end_date:
+        end = datetime.fromisoformat(end_date)
+        # If only date provided (no time), set to end of day
+        if len(end_date) == 10:  # Format: YYYY-MM-DD
+            # Add one day to include the entire end date
+            end = end.replace(hour=23, minute=59, second=59, microsecond=999999)
+    else:
+        end = now + timedelta(days=365)
+
+    if start.tzinfo is not None:
+        start = start.astimezone().replace(tzinfo=None)
+    if end.tzinfo is not None:
+        end = end.astimezone().replace(tzinfo=None)
+    return start, end
+
+
+def _calendars_to_search(
+    email: str,
+    password: str,
+    calendar_id: Optional[str] = None
+) -> List[caldav.Calendar]:
+    """Resolve the calendars to read events from (all non-reminder calendars by default)."""
+    if calendar_id:
+        return [caldav.Calendar(client=_get_cached_dav(email, password).client, url=calendar_id)]
+
+    all_calendars = _get_calendars(email, password)
+    if not all_calendars:
+        return []
+
+    # Filter out reminder calendars (they don't have events in the same format)
+    calendars_to_search = [
+        cal for cal in all_calendars
+        if cal.name and '⚠' not in cal.name and 'reminder' not in cal.name.lower()
+    ]
+
+    # If all calendars are filtered out, search all
+    return calendars_to_search or all_calendars
+
+
+async def _run_per_calendar(
+    calendars: List[caldav.Calendar],
+    operation: Callable[[caldav.Calendar], T]
+) -> List[Tuple[caldav.Calendar, Any]]:
+    """
+    Run a blocking operation on all calendars concurrently.
+
+    Returns (calendar, result) pairs; a failed calendar gets the raised
+    exception as its result.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def run(calendar: caldav.Calendar) -> T:
+        async with semaphore:
+            return await _to_thread(operation, calendar)
+
+    results = await asyncio.gather(*(run(cal) for cal in calendars), return_exceptions=True)
+    for calendar, result in zip(calendars, results):
+        if isinstance(result, BaseException):
+            if _is_stale_calendar_error(result):
+                _forget_calendar(str(calendar.url))
+            elif _is_dav_retry_error(result):
+                # Rebuild the client on the next call instead of reusing a broken one
+                _evict_dav_client(calendar.client)
+    return list(zip(calendars, results))
+
+
+def _date_windows(start: datetime, end: datetime) -> List[Tuple[datetime, datetime]]:
+    """Split a wide date range into consecutive _DATE_WINDOW sized windows."""
+    if end - start <= _DATE_WINDOW_THRESHOLD:
+        return [(start, end)]
+    windows = []
+    window_start = start
+    while window_start < end:
+        window_end = min(window_start + _DATE_WINDOW, end)
+        windows.append((window_start, window_end))
+        window_start = window_end
+    return windows
+
+
+async def _run_per_window(
+    calendars: List[caldav.Calendar],
+    windows: List[Tuple[datetime, datetime]],
+    operation: Callable[[caldav.Calendar, datetime, datetime], List[T]]
+) -> List[Tuple[caldav.Calendar, List[T]]]:
+    """
+    Run a blocking operation on every calendar and date window concurrently.
+
+    Returns (calendar, results) pairs with each calendar's window results
+    concatenated in window order. Calendars with a failed window are skipped.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def run(calendar: caldav.Calendar, window: Tuple[datetime, datetime]) -> List[T]:
+        async with semaphore:
+            return await _to_thread(operation, calendar, *window)
+
+    pairs = [(calendar, window) for calendar in calendars for window in windows]
+    results = await asyncio.gather(
+        *(run(calendar, window) for calendar, window in pairs),
+        return_exceptions=True
+    )
+
+    merged: Dict[str, List[T]] = {}
+    failed = set()
+    for (calendar, _), result in zip(pairs, results):
+        key = str(calendar.url)
+        if isinstance(result, BaseException):
+            if key not in failed:
+                if _is_stale_calendar_error(result):
+                    _forget_calendar(key)
+                elif _is_dav_retry_error(result):
+                    _evict_dav_client(calendar.client)
+            failed.add(key)
+            continue
+        merged.setdefault(key, []).extend(result)
+
+    return [
+        (calendar, merged.get(str(calendar.url), []))
+        for calendar in calendars
+        if str(calendar.url) not in failed
+    ]
+
+
+async def _search_calendars(
+    calendars: List[caldav.Calendar],
+    start: datetime,
+    end: datetime
+) -> List[Tuple[caldav.Calendar, List[caldav.Event]]]:
+    """
+    Run date_search on all calendars concurrently.
+
+    Wide date ranges are split into windows that are searched in parallel,
+    which keeps each REPORT response small. Calendars that fail to search are
+    skipped, so one broken calendar doesn't fail the whole listing.
+    """
+    windows = _date_windows(start, end)
+    if len(windows) == 1:
+        results = await _run_per_calendar(
+            calendars,
+            lambda calendar: calendar.date_search(start=start, end=end, expand=True)
+        )
+        return [
+            (calendar, events)
+            for calendar, events in results
+            if not isinstance(events, BaseException)
+        ]
+
+    results = await _run_per_window(
+        calendars,
+        windows,
+        lambda calendar, window_start, window_end: calendar.date_search(
+            start=window_start, end=window_end, expand=True
+        )
+    )
+    # Events overlapping a window boundary come back from both windows; expanded
+    # recurrence instances share a URL, so dedupe on URL and data together
+    return [
+        (calendar, list({(str(event.url), event.data): event for event in events}.values()))
+        for calendar, events in results
+    ]
+
+
+def _parse_freebusy(freebusy: caldav.FreeBusy) -> List[Dict[str, str]]:
+    """Convert the FREEBUSY periods of a free-busy-query response."""
+    periods = []
+    vfreebusy = freebusy.vobject_instance.vfreebusy
+    for prop in vfreebusy.contents.get('freebusy', []):
+        fbtype = prop.params.get('FBTYPE', ['BUSY'])[0]
+        for period_start, period_end in prop.value:
+            # Periods are either start/end or start/duration
+            if isinstance(period_end, timedelta):
+                period_end = period_start + period_end
+            periods.append({
+                "start": period_start.isoformat(),
+                "end": period_end.isoformat(),
+                "type": fbtype
+            })
+    return periods
+
+
+def _busy_periods_from_events(events: List[caldav.Event]) -> List[Dict[str, str]]:
+    """Build busy periods from full events (fallback when free-busy-query is unsupported)."""
+    periods = []
+    for event in events:
+        data = event.data
+        if not data or "BEGIN:VEVENT" not in data:
+            continue
+
+        for props in _scan_vevents(data):
+            # Transparent events don't block time
+            if props.get("TRANSP", ("", ""))[1].strip().upper() == "TRANSPARENT":
+                continue
+            if "DTSTART" not in props or "DTEND" not in props:
+                continue
+
+            periods.append({
+                "start": _ics_datetime(props["DTSTART"]),
+                "end": _ics_datetime(props["DTEND"]),
+                "type": "BUSY"
+            })
+    return periods
+
+
+def _calendar_multiget_body(urls: List[str]) -> bytes:
+    """Build a calendar-multiget REPORT body for the given event URLs."""
+    hrefs = "".join(f"<D:href>{xml_escape(urlparse(url).path)}</D:href>" for url in urls)
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<C:calendar-multiget xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:caldav">'
+        '<D:prop><D:getetag/><C:calendar-data/></D:prop>'
+        f'{hrefs}'
+        '</C:calendar-multiget>'
+    ).encode("utf-8")
+
+
+def _parse_multistatus_events(response: requests.Response, base_url: str) -> Dict[str, Tuple[str, str]]:
+    """
+    Stream-parse a multistatus response into {url: (etag, calendar_data)}.
+
+    The response must be requested with stream=True; its body is parsed as
+    it arrives from the socket instead of being buffered first.
+    """
+    events = {}
+    for elem in iter_responses(response):
+        href = elem.findtext(TAG_HREF)
+        data = elem.findtext(f".//{_TAG_CALENDAR_DATA}")
+        # Missing hrefs come back as 404 responses without calendar data
+        if href and data:
+            etag = elem.findtext(f".//{TAG_GETETAG}") or ""
+            events[urljoin(base_url, href)] = (etag, data)
+    return events
+
+
+def _load_events_bulk(
+    email: str,
+    password: str,
+    calendar_url: str,
+    urls: List[str]
+) -> Dict[str, Tuple[str, str]]:
+    """
+    Load several events of one calendar with a single calendar-multiget REPORT.
+
+    Returns:
+        Mapping of event URL, percent-encoded as the server sent it, to (etag, iCalendar data)
+    """
+    response = _raw_request(
+        email, password, "REPORT", calendar_url,
+        data=_calendar_multiget_body(urls),
+        headers={"Depth": "1", "Content-Type": "application/xml; charset=utf-8"},
+        stream=True
+    )
+    events = _parse_multistatus_events(response, calendar_url)
+    for url, (etag, data) in events.items():
+        _remember_event(url, etag, data)
+    return events
+
+
+def _ics_dt(dt: datetime) -> str:
+    """Format a datetime as an ICS DATE-TIME (YYYYMMDDTHHMMSS) without strftime."""
+    return f"{dt.year:04d}{dt.month:02d}{dt.day:02d}T{dt.hour:02d}{dt.minute:02d}{dt.second:02d}"
+
+
+def _ics_utc(dt: datetime) -> str:
+    """Format a datetime as an ICS UTC timestamp (naive values are local time)."""
+    return _ics_dt(dt.astimezone(timezone.utc)) + "Z"
+
+
+def _time_range_query_body(start: datetime, end: datetime, prop_filter: str = "") -> bytes:
+    """Build a calendar-query REPORT body for VEVENTs overlapping a time range, optionally further filtered."""
+    time_range = f'start="{_ics_utc(start)}" end="{_ics_utc(end)}"'
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<C:calendar-query xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:caldav">'
+        '<D:prop><D:getetag/>'
+        f'<C:calendar-data><C:expand {time_range}/></C:calendar-data>'
+        '</D:prop>'
+        '<C:filter><C:comp-filter name="VCALENDAR"><C:comp-filter name="VEVENT">'
+        f'<C:time-range {time_range}/>'
+        f'{prop_filter}'
+        '</C:comp-filter></C:comp-filter></C:filter>'
+        '</C:calendar-query>'
+    ).encode("utf-8")
+
+
+def _text_match_query_body(prop: str, query: str, start: datetime, end: datetime) -> bytes:
+    """Build a calendar-query REPORT body matching one VEVENT property against text."""
+    return _time_range_query_body(
+        start, end,
+        f'<C:prop-filter name="{prop}">'
+        f'<C:text-match collation="i;ascii-casemap">{xml_escape(query)}</C:text-match>'
+        '</C:prop-filter>'
+    )
+
+
+def _stream_date_search(
+    email: str,
+    password: str,
+    calendar_url: str,
+    start: datetime,
+    end: datetime
+) -> Iterator[Tuple[str, str]]:
+    """
+    Run a time-range calendar-query and yield (url, calendar_data) per event.
+
+    The response body is parsed as it arrives from the socket and each
+    response element is discarded once read, so neither the full XML nor
+    its tree is ever held in memory.
+    """
+    response = _raw_request(
+        email, password, "REPORT", calendar_url,
+        data=_time_range_query_body(start, end),
+        headers={"Depth": "1", "Content-Type": "application/xml; charset=utf-8"},
+        stream=True
+    )
+    for elem in iter_responses(response):
+        href = elem.findtext(TAG_HREF)
+        data = elem.findtext(f".//{_TAG_CALENDAR_DATA}")
+        if href and data:
+            yield urljoin(calendar_url, href), data
+
+
+def _text_match_report(
+    email: str,
+    password: str,
+    calendar_url: str,
+    prop: str,
+    query: str,
+    start: datetime,
+    end: datetime
+) -> Dict[str, Tuple[str, str]]:
+    """Find events of a calendar whose property contains the query, server-side."""
+    response = _raw_request(
+        email, password, "REPORT", calendar_url,
+        data=_text_match_query_body(prop, query, start, end),
+        headers={"Depth": "1", "Content-Type": "application/xml; charset=utf-8"},
+        stream=True
+    )
+    return _parse_multistatus_events(response, calendar_url)
+
+
+def _vevent_props(vevent: Any) -> Dict[str, Any]:
+    """Map uppercase property names to the first content line of a parsed VEVENT."""
+    return {name.upper(): lines[0] for name, lines in vevent.contents.items() if lines}
+
+
+def _vevent_text(props: Dict[str, Any], name: str, default: Optional[str] = "") -> Optional[str]:
+    """Get a text property value from _vevent_props output."""
+    return str(props[name].value) if name in props else default
+
+
+def _vevent_datetime(props: Dict[str, Any], name: str, default: Optional[str] = None) -> Optional[str]:
+    """Get a DATE/DATE-TIME property from _vevent_props output as an ISO string."""
+    if name not in props:
+        return default
+    value = props[name].value
+    return value.isoformat() if isinstance(value, (date, datetime)) else str(value)
+
+
+def _apply_event_update(
+    vevent: Any,
+    summary: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    description: Optional[str] = None,
+    location: Optional[str] = None,
+    attendees: Optional[List[str]] = None
+) -> None:
+    """Apply field updates (start/end already parsed) to a parsed VEVENT in place."""
+    if summary:
+        vevent.summary.value = summary
+    if start:
+        vevent.dtstart.value = start
+    if end:
+        vevent.dtend.value = end
+    if description is not None:
+        if 'description' in vevent.contents:
+            vevent.description.value = description
+        else:
+            vevent.add('description').value = description
+    if location is not None:
+        if 'location' in vevent.contents:
+            vevent.location.value = location
+        else:
+            vevent.add('location').value = location
+
+    # Update attendees
+    if attendees is not None:
+        # Remove existing attendees
+        for att in list(vevent.contents.get('attendee', [])):
+            vevent.remove(att)
+
+        # Add new attendees
+        for attendee_email in attendees:
+            att = vevent.add('attendee')
+            att.value = f'mailto:{attendee_email}'
+            att.params['CN'] = [attendee_email]
+            att.params['CUTYPE'] = ['INDIVIDUAL']
+            att.params['ROLE'] = ['REQ-PARTICIPANT']
+            att.params['PARTSTAT'] = ['NEEDS-ACTION']
+            att.params['RSVP'] = ['TRUE']
+
+
+def _attendee_emails(vevent: Any) -> List[str]:
+    """Extract attendee email addresses from a parsed VEVENT."""
+    return [
+        str(att.value).replace('mailto:', '')
+        for att in vevent.contents.get('attendee', [])
+        if att.value
+    ]
+
+
+def _notify_attendees(
+    organizer_email: str,
+    organizer_password: str,
+    attendee_list: List[str],
+    vevent: Any,
+    ical_data: str,
+    start: Optional[str] = None,
+    end: Optional[str] = None
+) -> None:
+    """Send update notifications for an event to all attendees."""
+    props = _vevent_props(vevent)
+    event_summary = _vevent_text(props, "SUMMARY")
+    event_start = _vevent_datetime(props, "DTSTART", start)
+    event_end = _vevent_datetime(props, "DTEND", end)
+    event_location = _vevent_text(props, "LOCATION", None)
+
+    for attendee_email in attendee_list:
+        try:
+            _send_calendar_invitation(
+                organizer_email=organizer_email,
+                organizer_password=organizer_password,
+                attendee_email=attendee_email,
+                ical_data=ical_data,
+                summary=event_summary,
+                start=event_start,
+                end=event_end,
+                location=event_location,
+                method="REQUEST"  # Use REQUEST for updates too
+            )
+        except Exception as e:
+            # Log error but don't fail the update
+            logging.error(f"Failed to send update notification to {attendee_email}: {e}")
+
+
+def _event_details(vevent: Any, event_url: str, attendee_list: List[str]) -> Dict[str, Any]:
+    """Build the response dict for an updated event."""
+    props = _vevent_props(vevent)
+    return {
+        "id": event_url,
+        "summary": _vevent_text(props, "SUMMARY"),
+        "start": _vevent_datetime(props, "DTSTART"),
+        "end": _vevent_datetime(props, "DTEND"),
+        "description": _vevent_text(props, "DESCRIPTION"),
+        "location": _vevent_text(props, "LOCATION"),
+        "attendees": attendee_list,
+        "url": event_url
+    }
 
 
 def _send_calendar_invitation(
@@ -72,23 +1043,19 @@ End: {end}"""
 
     # Modify iCalendar data to include METHOD
     # Replace the first line with VCALENDAR and METHOD
-    ical_lines = ical_data.strip().split('\n')
+    ical_lines = ical_data.strip().splitlines()
     if ical_lines[0] == 'BEGIN:VCALENDAR':
         # Insert METHOD after BEGIN:VCALENDAR
         ical_lines.insert(1, f'METHOD:{method}')
-        ical_with_method = '\n'.join(ical_lines)
-    else:
-        ical_with_method = ical_data
 
     # Add organizer to the VEVENT if not present
-    if 'ORGANIZER' not in ical_with_method:
+    if not any(line.startswith('ORGANIZER') for line in ical_lines):
         # Insert ORGANIZER after UID
-        ical_lines = ical_with_method.split('\n')
         for i, line in enumerate(ical_lines):
             if line.startswith('UID:'):
                 ical_lines.insert(i + 1, f'ORGANIZER;CN={organizer_email}:mailto:{organizer_email}')
                 break
-        ical_with_method = '\n'.join(ical_lines)
+    ical_with_method = '\r\n'.join(ical_lines) + '\r\n'
 
     # Create calendar part with proper content type
     cal_part = MIMEText(ical_with_method, 'calendar', 'utf-8')
@@ -97,7 +1064,7 @@ End: {end}"""
     msg.attach(cal_part)
 
     # Send via SMTP
-    smtp_client = smtplib.SMTP(config.SMTP_SERVER, config.SMTP_PORT)
+    smtp_client = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
     try:
         smtp_client.starttls()
         smtp_client.login(organizer_email, organizer_password)
@@ -116,10 +1083,10 @@ End: {end}"""
 
             # Try to append to Sent folder
             try:
-                imap_client.append(config.SENT_FOLDER, msg_bytes, flags=['\\Seen'])
+                imap_client.append(SENT_FOLDER, msg_bytes, flags=['\\Seen'])
             except Exception:
                 # Try common alternatives
-                for folder_name in ['Sent', 'Sent Items', config.SENT_FOLDER]:
+                for folder_name in ['Sent', 'Sent Items', SENT_FOLDER]:
                     try:
                         imap_client.append(folder_name, msg_bytes, flags=['\\Seen'])
                         break
@@ -140,9 +1107,7 @@ async def list_calendars(context: Context) -> List[Dict[str, Any]]:
         List of calendars with id, name, and description
     """
     email, password = require_auth(context)
-    client = _get_caldav_client(email, password)
-    principal = client.principal()
-    calendars = principal.calendars()
+    calendars = await _to_thread(_get_calendars, email, password)
 
     result = []
     for cal in calendars:
@@ -155,6 +1120,129 @@ async def list_calendars(context: Context) -> List[Dict[str, Any]]:
     return result
 
 
+def _events_from_ics(
+    url: str,
+    data: str,
+    calendar_name: str,
+    query_lower: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Build event dicts from the raw ICS of one calendar object.
+
+    With query_lower, events whose summary, description and location don't
+    contain it are skipped before their dict is built.
+    """
+    # Calendars may mix in VTODO/VJOURNAL objects
+    if "BEGIN:VEVENT" not in data:
+        return
+
+    # Grep the unfolded text before scanning: an object that doesn't contain
+    # the query anywhere can't match it. Queries with characters that ICS
+    # escapes can't be looked up in raw text, so those skip this check.
+    if query_lower and not _ICS_CHARS_NEEDING_ESCAPE.intersection(query_lower):
+        data = _join_ics_folds(data)
+        if query_lower not in data.lower():
+            return
+
+    for props in _scan_vevents(data):
+        summary = _ics_text(props.get("SUMMARY"))
+        description = _ics_text(props.get("DESCRIPTION"))
+        location = _ics_text(props.get("LOCATION"))
+
+        # Filter before building the result dict
+        if query_lower and not (
+            query_lower in summary.lower()
+            or query_lower in description.lower()
+            or query_lower in location.lower()
+        ):
+            continue
+
+        yield {
+            "id": url,
+            "summary": summary,
+            "description": description,
+            "start": _ics_datetime(props.get("DTSTART")),
+            "end": _ics_datetime(props.get("DTEND")),
+            "location": location,
+            "calendar": calendar_name,
+            "url": url
+        }
+
+
+async def _iter_calendar_events(
+    email: str,
+    password: str,
+    calendars: List[caldav.Calendar],
+    start: datetime,
+    end: datetime,
+    query_lower: Optional[str] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """Search calendars in parallel and yield their events one at a time."""
+    windows = _date_windows(start, end)
+    if len(windows) == 1:
+        for calendar, events in await _search_calendars(calendars, start, end):
+            calendar_name = calendar.name or "Unknown"
+            for event in events:
+                # Raw ICS stays unparsed until the event is reached
+                data = event.data
+                if data:
+                    for result in _events_from_ics(str(event.url), data, calendar_name, query_lower):
+                        yield result
+        return
+
+    # Wide ranges bypass date_search: each window's REPORT is stream-parsed and
+    # its events expanded and extracted in the worker thread, one object at a time
+    def load(calendar: caldav.Calendar, window_start: datetime, window_end: datetime) -> List[Dict[str, Any]]:
+        calendar_name = calendar.name or "Unknown"
+        return [
+            result
+            for url, data in _stream_date_search(email, password, str(calendar.url), window_start, window_end)
+            for result in _events_from_ics(
+                url, _expand_recurrences(data, window_start, window_end), calendar_name, query_lower
+            )
+        ]
+
+    for _, results in await _run_per_window(calendars, windows, load):
+        # Events overlapping a window boundary come back from both windows
+        seen = set()
+        for result in results:
+            key = (result["id"], result["start"])
+            if key not in seen:
+                seen.add(key)
+                yield result
+
+
+async def iter_events(
+    context: Context,
+    calendar_id: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    query: Optional[str] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Iterate over calendar events, parsing each event only when it is reached.
+
+    Args:
+        calendar_id: Specific calendar URL/ID (optional, defaults to all non-reminder calendars)
+        start_date: Start date filter in ISO format (YYYY-MM-DD)
+        end_date: End date filter in ISO format (YYYY-MM-DD)
+        query: Only yield events whose summary, description or location contains this text (optional)
+
+    Yields:
+        Event details, one event at a time
+    """
+    email, password = require_auth(context)
+    start, end = _parse_date_range(start_date, end_date)
+
+    calendars_to_search = await _to_thread(_calendars_to_search, email, password, calendar_id)
+    if not calendars_to_search:
+        return
+
+    query_lower = query.lower() if query else None
+    async for event in _iter_calendar_events(email, password, calendars_to_search, start, end, query_lower):
+        yield event
+
+
 async def list_events(
     context: Context,
     calendar_id: Optional[str] = None,
@@ -172,101 +1260,80 @@ async def list_events(
     Returns:
         List of events with details
     """
-    email, password = require_auth(context)
-    client = _get_caldav_client(email, password)
-    principal = client.principal()
+    return [event async for event in iter_events(context, calendar_id, start_date, end_date)]
 
-    # Parse dates
-    if start_date:
-        start = datetime.fromisoformat(start_date)
-        # If only date provided (no time), set to start of day
-        if len(start_date) == 10:  # Format: YYYY-MM-DD
-            start = start.replace(hour=0, minute=0, second=0, microsecond=0)
-    else:
-        start = datetime.now() - timedelta(days=90)
 
-    if end_date:
-        end = datetime.fromisoformat(end_date)
-        # If only date provided (no time), set to end of day
-        if len(end_date) == 10:  # Format: YYYY-MM-DD
-            # Add one day to include the entire end date
-            end = end.replace(hour=23, minute=59, second=59, microsecond=999999)
-    else:
-        end = datetime.now() + timedelta(days=365)
+async def get_freebusy(
+    context: Context,
+    start_date: str,
+    end_date: str,
+    calendar_id: Optional[str] = None
+) -> List[Dict[str, str]]:
+    """
+    Get busy time periods without downloading full events.
 
-    result = []
+    Uses a CalDAV free-busy-query REPORT per calendar; calendars whose server
+    rejects the query fall back to deriving busy periods from their events.
 
-    # Get calendars
-    if calendar_id:
-        calendars_to_search = [caldav.Calendar(client=client, url=calendar_id)]
-    else:
-        all_calendars = principal.calendars()
-        if not all_calendars:
-            return []
+    Args:
+        start_date: Start of the period in ISO format
+        end_date: End of the period in ISO format
+        calendar_id: Specific calendar URL/ID (optional, defaults to all non-reminder calendars)
 
-        # Filter out reminder calendars (they don't have events in the same format)
-        calendars_to_search = [
-            cal for cal in all_calendars
-            if cal.name and '⚠' not in cal.name and 'reminder' not in cal.name.lower()
-        ]
+    Returns:
+        List of busy periods with start, end, type and calendar name, followed
+        by a calendar/error entry for each calendar that couldn't be read
+    """
+    email, password = require_auth(context)
+    start, end = _parse_date_range(start_date, end_date)
 
-        # If all calendars are filtered out, search all
-        if not calendars_to_search:
-            calendars_to_search = all_calendars
+    calendars = await _to_thread(_calendars_to_search, email, password, calendar_id)
+    if not calendars:
+        return []
 
-    # Search events in all relevant calendars
-    for calendar in calendars_to_search:
-        try:
-            # Fetch events using date_search
-            events = calendar.date_search(start=start, end=end, expand=True)
+    results = await _run_per_calendar(
+        calendars,
+        lambda calendar: calendar.freebusy_request(start=start, end=end)
+    )
 
-            for event in events:
-                try:
-                    event.load()  # Ensure event data is loaded
-                    vevent = event.vobject_instance.vevent
-
-                    # Parse start/end dates safely
-                    start_value = None
-                    end_value = None
-
-                    if hasattr(vevent, 'dtstart') and vevent.dtstart:
-                        try:
-                            start_value = vevent.dtstart.value
-                            if hasattr(start_value, 'isoformat'):
-                                start_value = start_value.isoformat()
-                            else:
-                                start_value = str(start_value)
-                        except Exception as _e:
-                            pass
-
-                    if hasattr(vevent, 'dtend') and vevent.dtend:
-                        try:
-                            end_value = vevent.dtend.value
-                            if hasattr(end_value, 'isoformat'):
-                                end_value = end_value.isoformat()
-                            else:
-                                end_value = str(end_value)
-                        except Exception as _e:
-                            pass
-
-                    result.append({
-                        "id": str(event.url),
-                        "summary": str(vevent.summary.value) if hasattr(vevent, 'summary') and vevent.summary else "",
-                        "description": str(vevent.description.value) if hasattr(vevent, 'description') and vevent.description else "",
-                        "start": start_value,
-                        "end": end_value,
-                        "location": str(vevent.location.value) if hasattr(vevent, 'location') and vevent.location else "",
-                        "calendar": calendar.name or "Unknown",
-                        "url": str(event.url)
-                    })
-                except Exception as _e:
-                    # Skip malformed events
-                    continue
-        except Exception as _e:
-            # Skip calendars that fail to search
+    result = []
+    errors = []
+    unsupported = []
+    for calendar, fb in results:
+        if isinstance(fb, BaseException):
+            # Calendars that reject free-busy-query (e.g. 405/501) fall back to date_search;
+            # auth and not-found failures would only repeat there
+            if isinstance(fb, ReportError):
+                unsupported.append(calendar)
+            else:
+                errors.append({"calendar": calendar.name or "Unknown", "error": str(fb)})
             continue
-
-    return result
+        try:
+            periods = _parse_freebusy(fb)
+        except Exception:
+            # A 2xx answer that isn't a usable VFREEBUSY: don't report the calendar as free
+            unsupported.append(calendar)
+            continue
+        for period in periods:
+            period["calendar"] = calendar.name or "Unknown"
+            result.append(period)
+
+    fallback = await _search_calendars(unsupported, start, end) if unsupported else []
+    searched = {str(calendar.url) for calendar, _ in fallback}
+    for calendar in unsupported:
+        if str(calendar.url) not in searched:
+            errors.append({
+                "calendar": calendar.name or "Unknown",
+                "error": "Free-busy query unsupported and event search failed"
+            })
+    for calendar, events in fallback:
+        for period in _busy_periods_from_events(events):
+            period["calendar"] = calendar.name or "Unknown"
+            result.append(period)
+
+    result.sort(key=lambda period: period["start"])
+    # Failed calendars are reported instead of being shown as free
+    return result + errors
 
 
 async def create_event(
@@ -295,14 +1362,13 @@ async def create_event(
         Created event details
     """
     email, password = require_auth(context)
-    client = _get_caldav_client(email, password)
-    principal = client.principal()
 
     # Get calendar
     if calendar_id:
-        calendar = caldav.Calendar(client=client, url=calendar_id)
+        dav = await _to_thread(_get_cached_dav, email, password)
+        calendar = caldav.Calendar(client=dav.client, url=calendar_id)
     else:
-        all_calendars = principal.calendars()
+        all_calendars = await _to_thread(_get_calendars, email, password)
         if not all_calendars:
             raise ValueError("No calendars found")
 
@@ -317,57 +1383,62 @@ async def create_event(
 
         calendar = event_calendars[0]
 
-    # Build iCalendar data with proper formatting for iCloud
+    # Build iCalendar data with proper formatting for iCloud (CRLF line endings, escaped text)
     start_dt = datetime.fromisoformat(start)
     end_dt = datetime.fromisoformat(end)
-    now = datetime.now()
-
-    # Generate UID without dots (iCloud compatible)
-    uid = f"{int(now.timestamp())}{now.microsecond}@icloud-mcp"
-
-    # Build proper iCalendar format (iCloud is very strict about formatting)
-    ical_data = f"""BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//iCloud MCP//EN
-CALSCALE:GREGORIAN
-BEGIN:VEVENT
-UID:{uid}
-DTSTAMP:{now.strftime('%Y%m%dT%H%M%SZ')}
-DTSTART:{start_dt.strftime('%Y%m%dT%H%M%S')}
-DTEND:{end_dt.strftime('%Y%m%dT%H%M%S')}
-SUMMARY:{summary}
-STATUS:CONFIRMED
-SEQUENCE:0
-"""
-
+    now = datetime.now(timezone.utc)
+
+    # UID without dots (iCloud compatible)
+    uid = uuid.uuid4().hex
+
+    buf = io.BytesIO()
+    buf.write(_ICS_PREFIX)
+    buf.write(f"UID:{uid}@icloud-mcp\r\n".encode())
+    buf.write(f"DTSTAMP:{_ics_dt(now)}Z\r\n".encode())
+    buf.write(f"DTSTART:{_ics_dt(start_dt)}\r\n".encode())
+    buf.write(f"DTEND:{_ics_dt(end_dt)}\r\n".encode())
+    buf.write(f"SUMMARY:{summary.translate(_ICS_TEXT_ESCAPE_TABLE)}\r\n".encode())
     if description:
-        # Escape special characters in description
-        desc_escaped = description.replace('\\', '\\\\').replace(',', '\\,').replace(';', '\\;').replace('\n', '\\n')
-        ical_data += f"DESCRIPTION:{desc_escaped}\n"
+        buf.write(f"DESCRIPTION:{description.translate(_ICS_TEXT_ESCAPE_TABLE)}\r\n".encode())
     if location:
-        loc_escaped = location.replace('\\', '\\\\').replace(',', '\\,').replace(';', '\\;')
-        ical_data += f"LOCATION:{loc_escaped}\n"
+        buf.write(f"LOCATION:{location.translate(_ICS_TEXT_ESCAPE_TABLE)}\r\n".encode())
 
     # Add attendees (meeting invitations)
     if attendees:
         for attendee_email in attendees:
             # Format: ATTENDEE;CN=email;ROLE=REQ-PARTICIPANT;PARTSTAT=NEEDS-ACTION;RSVP=TRUE:mailto:email
-            ical_data += f"ATTENDEE;CN={attendee_email};CUTYPE=INDIVIDUAL;ROLE=REQ-PARTICIPANT;PARTSTAT=NEEDS-ACTION;RSVP=TRUE:mailto:{attendee_email}\n"
-
-    ical_data += "END:VEVENT\nEND:VCALENDAR"
-
-    # Create event using add_event (more reliable than save_event for iCloud)
+            buf.write(
+                f"ATTENDEE;CN={attendee_email};CUTYPE=INDIVIDUAL;ROLE=REQ-PARTICIPANT;"
+                f"PARTSTAT=NEEDS-ACTION;RSVP=TRUE:mailto:{attendee_email}\r\n".encode()
+            )
+
+    buf.write(_ICS_SUFFIX)
+    ical_data = buf.getvalue().decode("utf-8")
+
+    # Create the event with a batched PUT; If-None-Match keeps it from overwriting anything
+    calendar_url = str(calendar.url)
+    if not calendar_url.endswith('/'):
+        calendar_url += '/'
+    event_url = f"{calendar_url}{uid}.ics"
     try:
-        event = calendar.add_event(ical_data)
+        await _queue_write(
+            email, password, "PUT", event_url,
+            data=ical_data.encode("utf-8"),
+            headers={"Content-Type": "text/calendar; charset=utf-8", "If-None-Match": "*"}
+        )
     except Exception as e:
-        # If add_event fails, try save_event as fallback
+        if _is_stale_calendar_error(e):
+            _forget_calendar(str(calendar.url))
+        elif _is_dav_retry_error(e):
+            _evict_cached_dav(email, password)
         raise ValueError(f"Failed to create event in calendar '{calendar.name}': {str(e)}")
 
     # Send email invitations to attendees (iTIP protocol)
     if attendees:
         for attendee_email in attendees:
             try:
-                _send_calendar_invitation(
+                await _to_thread(
+                    _send_calendar_invitation,
                     organizer_email=email,
                     organizer_password=password,
                     attendee_email=attendee_email,
@@ -381,11 +1452,10 @@ SEQUENCE:0
             except Exception as e:
                 # Log error but don't fail the event creation
                 # The event is already created, we just failed to send the invitation
-                import logging
                 logging.error(f"Failed to send invitation to {attendee_email}: {e}")
 
     return {
-        "id": str(event.url),
+        "id": event_url,
         "summary": summary,
         "start": start,
         "end": end,
@@ -393,7 +1463,7 @@ SEQUENCE:0
         "location": location or "",
         "attendees": attendees or [],
         "calendar": calendar.name,
-        "url": str(event.url)
+        "url": event_url
     }
 
 
@@ -424,107 +1494,132 @@ async def update_event(
     """
     email, password = require_auth(context)
 
-    # Create a client with the correct base URL for this specific event
-    # This prevents URL joining errors when event is on a different server (e.g., p72-caldav.icloud.com)
-    parsed = urlparse(event_id)
-    event_base_url = f"{parsed.scheme}://{parsed.netloc}"
-    event_client = caldav.DAVClient(url=event_base_url, username=email, password=password)
+    # Parse datetimes once, before any network round-trip
+    start_dt = datetime.fromisoformat(start) if start else None
+    end_dt = datetime.fromisoformat(end) if end else None
 
+    # Load the event straight from its URL (no principal or calendar discovery)
     try:
-        # Load existing event using CalendarObjectResource
-        event = caldav.CalendarObjectResource(client=event_client, url=event_id)
-        event.load()
+        etag, ical_data = await _to_thread(_get_event, email, password, event_id)
     except Exception as e:
         raise Exception(f"Error loading event: {str(e)}")
 
-    vevent = event.vobject_instance.vevent
-
-    # Update fields
-    if summary:
-        vevent.summary.value = summary
-    if start:
-        vevent.dtstart.value = datetime.fromisoformat(start)
-    if end:
-        vevent.dtend.value = datetime.fromisoformat(end)
-    if description is not None:
-        if hasattr(vevent, 'description'):
-            vevent.description.value = description
-        else:
-            vevent.add('description').value = description
-    if location is not None:
-        if hasattr(vevent, 'location'):
-            vevent.location.value = location
-        else:
-            vevent.add('location').value = location
-
-    # Update attendees
-    if attendees is not None:
-        # Remove existing attendees
-        if hasattr(vevent, 'attendee_list'):
-            for att in list(vevent.attendee_list):
-                vevent.remove(att)
-
-        # Add new attendees
-        for attendee_email in attendees:
-            att = vevent.add('attendee')
-            att.value = f'mailto:{attendee_email}'
-            att.params['CN'] = [attendee_email]
-            att.params['CUTYPE'] = ['INDIVIDUAL']
-            att.params['ROLE'] = ['REQ-PARTICIPANT']
-            att.params['PARTSTAT'] = ['NEEDS-ACTION']
-            att.params['RSVP'] = ['TRUE']
+    vcalendar = vobject.readOne(ical_data)
+    vevent = vcalendar.vevent
+    _apply_event_update(vevent, summary, start_dt, end_dt, description, location, attendees)
 
-    # Save changes - use PUT request directly to avoid parent dependency
+    # Save changes with a conditional PUT so concurrent edits aren't overwritten
     try:
-        # Serialize the updated vCalendar data and send PUT request
-        updated_ical = event.vobject_instance.serialize()
-        event_client.put(event_id, updated_ical, {"Content-Type": "text/calendar; charset=utf-8"})
+        updated_ical = vcalendar.serialize()
+        headers = {"Content-Type": "text/calendar; charset=utf-8"}
+        if etag:
+            headers["If-Match"] = etag
+        response = await _queue_write(
+            email, password, "PUT", event_id, data=updated_ical.encode("utf-8"), headers=headers
+        )
     except Exception as e:
+        _forget_event(event_id)
         raise Exception(f"Error saving event: {str(e)}")
+    _remember_event(event_id, response.headers.get("ETag", ""), updated_ical)
 
-    # Extract attendees for response
-    attendee_list = []
-    if hasattr(vevent, 'attendee_list'):
-        for att in vevent.attendee_list:
-            if hasattr(att, 'value'):
-                email_addr = str(att.value).replace('mailto:', '')
-                attendee_list.append(email_addr)
+    attendee_list = _attendee_emails(vevent)
 
     # Send update notifications to attendees if attendees were modified
     if attendees is not None and attendee_list:
-        event_summary = str(vevent.summary.value) if hasattr(vevent, 'summary') else ""
-        event_start = vevent.dtstart.value.isoformat() if hasattr(vevent, 'dtstart') else start
-        event_end = vevent.dtend.value.isoformat() if hasattr(vevent, 'dtend') else end
-        event_location = str(vevent.location.value) if hasattr(vevent, 'location') else None
+        await _to_thread(_notify_attendees, email, password, attendee_list, vevent, updated_ical, start, end)
 
-        for attendee_email in attendee_list:
-            try:
-                _send_calendar_invitation(
-                    organizer_email=email,
-                    organizer_password=password,
-                    attendee_email=attendee_email,
-                    ical_data=updated_ical,
-                    summary=event_summary,
-                    start=event_start,
-                    end=event_end,
-                    location=event_location,
-                    method="REQUEST"  # Use REQUEST for updates too
-                )
-            except Exception as e:
-                # Log error but don't fail the update
-                import logging
-                logging.error(f"Failed to send update notification to {attendee_email}: {e}")
+    return _event_details(vevent, event_id, attendee_list)
 
-    return {
-        "id": str(event.url),
-        "summary": str(vevent.summary.value) if hasattr(vevent, 'summary') else "",
-        "start": vevent.dtstart.value.isoformat() if hasattr(vevent, 'dtstart') else None,
-        "end": vevent.dtend.value.isoformat() if hasattr(vevent, 'dtend') else None,
-        "description": str(vevent.description.value) if hasattr(vevent, 'description') else "",
-        "location": str(vevent.location.value) if hasattr(vevent, 'location') else "",
-        "attendees": attendee_list,
-        "url": str(event.url)
-    }
+
+async def update_events_bulk(
+    context: Context,
+    updates: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Update several calendar events at once.
+
+    Events are loaded with one calendar-multiget REPORT per calendar and
+    saved with conditional PUTs through the batched write queue.
+
+    Args:
+        updates: List of updates, each with "event_id" and any of "summary", "start",
+            "end", "description", "location", "attendees"
+
+    Returns:
+        Updated event details, or {"id", "error"} for each update that failed
+    """
+    email, password = require_auth(context)
+
+    # Group event URLs by their calendar collection
+    by_calendar: Dict[str, List[str]] = {}
+    for update in updates:
+        event_id = update.get("event_id")
+        if event_id:
+            by_calendar.setdefault(event_id.rsplit("/", 1)[0] + "/", []).append(event_id)
+
+    loaded: Dict[str, Tuple[str, str]] = {}
+    load_errors: Dict[str, BaseException] = {}
+    results = await asyncio.gather(
+        *(_to_thread(_load_events_bulk, email, password, calendar_url, urls)
+          for calendar_url, urls in by_calendar.items()),
+        return_exceptions=True
+    )
+    for urls, result in zip(by_calendar.values(), results):
+        if isinstance(result, BaseException):
+            # Report the multiget failure itself for every event of that calendar
+            for url in urls:
+                load_errors[url] = result
+        else:
+            # Match on the decoded URL so differently percent-encoded IDs still find their event
+            loaded.update((unquote(url), event) for url, event in result.items())
+
+    async def apply(update: Dict[str, Any]) -> Dict[str, Any]:
+        event_id = update.get("event_id")
+        fields = {key: update.get(key) for key in ("summary", "start", "end", "description", "location", "attendees")}
+        try:
+            if not event_id:
+                raise ValueError("Missing event_id")
+            if event_id in load_errors:
+                raise ValueError(f"Error loading event: {str(load_errors[event_id])}")
+            if unquote(event_id) not in loaded:
+                raise ValueError("Error loading event: not found")
+            etag, ical_data = loaded[unquote(event_id)]
+
+            vcalendar = vobject.readOne(ical_data)
+            vevent = vcalendar.vevent
+            _apply_event_update(
+                vevent,
+                summary=fields["summary"],
+                start=datetime.fromisoformat(fields["start"]) if fields["start"] else None,
+                end=datetime.fromisoformat(fields["end"]) if fields["end"] else None,
+                description=fields["description"],
+                location=fields["location"],
+                attendees=fields["attendees"]
+            )
+            updated_ical = vcalendar.serialize()
+
+            headers = {"Content-Type": "text/calendar; charset=utf-8"}
+            if etag:
+                headers["If-Match"] = etag
+            response = await _queue_write(
+                email, password, "PUT", event_id,
+                data=updated_ical.encode("utf-8"), headers=headers
+            )
+        except Exception as e:
+            if event_id:
+                _forget_event(event_id)
+            return {"id": event_id, "error": str(e)}
+        _remember_event(event_id, response.headers.get("ETag", ""), updated_ical)
+
+        attendee_list = _attendee_emails(vevent)
+        if fields["attendees"] is not None and attendee_list:
+            await _to_thread(
+                _notify_attendees, email, password, attendee_list, vevent, updated_ical,
+                fields["start"], fields["end"]
+            )
+        return _event_details(vevent, event_id, attendee_list)
+
+    return list(await asyncio.gather(*(apply(update) for update in updates)))
 
 
 async def delete_event(context: Context, event_id: str) -> Dict[str, str]:
@@ -539,15 +1634,6 @@ async def delete_event(context: Context, event_id: str) -> Dict[str, str]:
     """
     email, password = require_auth(context)
 
-    # Create a client with the correct base URL for this specific event
-    # This prevents URL joining errors when event is on a different server (e.g., p72-caldav.icloud.com)
-    parsed = urlparse(event_id)
-    event_base_url = f"{parsed.scheme}://{parsed.netloc}"
-    event_client = caldav.DAVClient(url=event_base_url, username=email, password=password)
-
-    # Use CalendarObjectResource to handle full URLs correctly
-    event = caldav.CalendarObjectResource(client=event_client, url=event_id)
-
     # Load event to get attendees before deleting
     attendee_list = []
     event_summary = ""
@@ -557,41 +1643,32 @@ async def delete_event(context: Context, event_id: str) -> Dict[str, str]:
     ical_data = None
 
     try:
-        event.load()
-        vevent = event.vobject_instance.vevent
+        _, ical_data = await _to_thread(_get_event, email, password, event_id)
+        vevent = vobject.readOne(ical_data).vevent
 
         # Extract event details
-        event_summary = str(vevent.summary.value) if hasattr(vevent, 'summary') else "Event"
-        if hasattr(vevent, 'dtstart'):
-            event_start = vevent.dtstart.value.isoformat() if hasattr(vevent.dtstart.value, 'isoformat') else str(vevent.dtstart.value)
-        if hasattr(vevent, 'dtend'):
-            event_end = vevent.dtend.value.isoformat() if hasattr(vevent.dtend.value, 'isoformat') else str(vevent.dtend.value)
-        if hasattr(vevent, 'location'):
-            event_location = str(vevent.location.value)
-
-        # Extract attendees
-        if hasattr(vevent, 'attendee_list'):
-            for att in vevent.attendee_list:
-                if hasattr(att, 'value'):
-                    email_addr = str(att.value).replace('mailto:', '')
-                    attendee_list.append(email_addr)
-
-        # Get the iCalendar data for CANCEL notifications
-        ical_data = event.vobject_instance.serialize()
+        props = _vevent_props(vevent)
+        event_summary = _vevent_text(props, "SUMMARY", "Event")
+        event_start = _vevent_datetime(props, "DTSTART", "")
+        event_end = _vevent_datetime(props, "DTEND", "")
+        event_location = _vevent_text(props, "LOCATION", None)
+        attendee_list = _attendee_emails(vevent)
 
     except Exception as e:
         # If we can't load the event, just delete it
-        import logging
+        ical_data = None
         logging.warning(f"Could not load event details before deletion: {e}")
 
-    # Delete the event
-    event.delete()
+    # Delete the event directly by URL
+    _forget_event(event_id)
+    await _queue_write(email, password, "DELETE", event_id)
 
     # Send cancellation notifications to attendees
     if attendee_list and ical_data:
         for attendee_email in attendee_list:
             try:
-                _send_calendar_invitation(
+                await _to_thread(
+                    _send_calendar_invitation,
                     organizer_email=email,
                     organizer_password=password,
                     attendee_email=attendee_email,
@@ -604,7 +1681,6 @@ async def delete_event(context: Context, event_id: str) -> Dict[str, str]:
                 )
             except Exception as e:
                 # Log error but don't fail the deletion
-                import logging
                 logging.error(f"Failed to send cancellation to {attendee_email}: {e}")
 
     return {"status": "success", "message": f"Event {event_id} deleted"}
@@ -620,8 +1696,11 @@ async def search_events(
     """
     Search for events by text query.
 
+    Matching runs on the server with CalDAV text-match filters; calendars
+    whose server rejects them are filtered client-side.
+
     Args:
-        query: Search text (matches summary and description)
+        query: Search text (matches summary, description and location)
         calendar_id: Specific calendar URL/ID (optional)
         start_date: Start date filter in ISO format (optional)
         end_date: End date filter in ISO format (optional)
@@ -629,16 +1708,63 @@ async def search_events(
     Returns:
         List of matching events
     """
-    # Get all events
-    events = await list_events(context, calendar_id, start_date, end_date)
+    email, password = require_auth(context)
+    start, end = _parse_date_range(start_date, end_date)
+
+    calendars = await _to_thread(_calendars_to_search, email, password, calendar_id)
+    if not calendars:
+        return []
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def text_match(calendar: caldav.Calendar, prop: str) -> Dict[str, Tuple[str, str]]:
+        async with semaphore:
+            return await _to_thread(
+                _text_match_report, email, password, str(calendar.url), prop, query, start, end
+            )
+
+    # One text-match REPORT per calendar and property, since anyof filters
+    # aren't reliably supported; matches are unioned by URL
+    pairs = [(calendar, prop) for calendar in calendars for prop in _SEARCH_PROPERTIES]
+    reports = await asyncio.gather(
+        *(text_match(calendar, prop) for calendar, prop in pairs),
+        return_exceptions=True
+    )
+
+    matches: Dict[str, Dict[str, Tuple[str, str]]] = {}
+    failed: Dict[str, BaseException] = {}
+    for (calendar, _), report in zip(pairs, reports):
+        key = str(calendar.url)
+        if isinstance(report, BaseException):
+            failed.setdefault(key, report)
+            if _is_stale_calendar_error(report):
+                _forget_calendar(key)
+            elif _is_dav_retry_error(report):
+                _evict_dav_client(calendar.client)
+        else:
+            matches.setdefault(key, {}).update(report)
 
-    # Filter by query
     query_lower = query.lower()
-    filtered_events = [
-        event for event in events
-        if query_lower in event.get("summary", "").lower()
-        or query_lower in event.get("description", "").lower()
-        or query_lower in event.get("location", "").lower()
-    ]
+    result = []
+    fallback = []
+    for calendar in calendars:
+        key = str(calendar.url)
+        error = failed.get(key)
+        if error is not None:
+            # Servers that reject text-match get the client-side filter instead
+            response = getattr(error, "response", None)
+            if response is not None and response.status_code in UNSUPPORTED_QUERY_STATUSES:
+                fallback.append(calendar)
+            continue
 
-    return filtered_events
+        calendar_name = calendar.name or "Unknown"
+        for url, (_, data) in matches.get(key, {}).items():
+            # Re-check locally: the server matches per object, results are per instance
+            result.extend(_events_from_ics(url, _expand_recurrences(data, start, end), calendar_name, query_lower))
+
+    if fallback:
+        result.extend([
+            event async for event in _iter_calendar_events(email, password, fallback, start, end, query_lower)
+        ])
+
+    return result
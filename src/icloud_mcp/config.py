@@ -1,33 +1,61 @@
 """Configuration management for iCloud MCP server."""
 
 import os
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Optional
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
 
+def _env(name: str, default: Optional[str] = None, repr: bool = True) -> Any:
+    """Default factory reading an environment variable when Config is created."""
+    return field(default_factory=lambda: os.getenv(name, default), repr=repr)
+
+
+def _env_int(name: str, default: str) -> Any:
+    """Default factory reading an integer environment variable when Config is created."""
+    return field(default_factory=lambda: int(os.getenv(name, default)))
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """Configuration for iCloud MCP server (stateless, loaded from environment)."""
 
     # Default iCloud servers
-    CALDAV_SERVER: str = os.getenv("CALDAV_SERVER", "https://caldav.icloud.com")
-    CARDDAV_SERVER: str = os.getenv("CARDDAV_SERVER", "https://contacts.icloud.com")
-    IMAP_SERVER: str = os.getenv("IMAP_SERVER", "imap.mail.me.com")
-    SMTP_SERVER: str = os.getenv("SMTP_SERVER", "smtp.mail.me.com")
+    CALDAV_SERVER: str = _env("CALDAV_SERVER", "https://caldav.icloud.com")
+    CARDDAV_SERVER: str = _env("CARDDAV_SERVER", "https://contacts.icloud.com")
+    IMAP_SERVER: str = _env("IMAP_SERVER", "imap.mail.me.com")
+    SMTP_SERVER: str = _env("SMTP_SERVER", "smtp.mail.me.com")
 
     # Ports
-    MCP_SERVER_PORT: int = int(os.getenv("MCP_SERVER_PORT", "8000"))
-    IMAP_PORT: int = int(os.getenv("IMAP_PORT", "993"))
-    SMTP_PORT: int = int(os.getenv("SMTP_PORT", "587"))
+    MCP_SERVER_PORT: int = _env_int("MCP_SERVER_PORT", "8000")
+    IMAP_PORT: int = _env_int("IMAP_PORT", "993")
+    SMTP_PORT: int = _env_int("SMTP_PORT", "587")
 
     # Email folders
-    SENT_FOLDER: str = os.getenv("SENT_FOLDER", "Sent Messages")
+    SENT_FOLDER: str = _env("SENT_FOLDER", "Sent Messages")
+
+    # Directory for the contacts sync cache (opt-in; unset or empty keeps it in memory only)
+    CONTACTS_CACHE_DIR: str = _env("CONTACTS_CACHE_DIR", "")
 
     # Fallback credentials (if not provided in headers)
-    FALLBACK_EMAIL: Optional[str] = os.getenv("ICLOUD_EMAIL")
-    FALLBACK_PASSWORD: Optional[str] = os.getenv("ICLOUD_APP_SPECIFIC_PASSWORD")
+    FALLBACK_EMAIL: Optional[str] = _env("ICLOUD_EMAIL")
+    FALLBACK_PASSWORD: Optional[str] = _env("ICLOUD_APP_SPECIFIC_PASSWORD", repr=False)
 
 
 config = Config()
+
+# Module-level names for hot paths (plain global lookups instead of attribute access)
+CALDAV_SERVER = config.CALDAV_SERVER
+CARDDAV_SERVER = config.CARDDAV_SERVER
+IMAP_SERVER = config.IMAP_SERVER
+SMTP_SERVER = config.SMTP_SERVER
+MCP_SERVER_PORT = config.MCP_SERVER_PORT
+IMAP_PORT = config.IMAP_PORT
+SMTP_PORT = config.SMTP_PORT
+SENT_FOLDER = config.SENT_FOLDER
+CONTACTS_CACHE_DIR = config.CONTACTS_CACHE_DIR
+FALLBACK_EMAIL = config.FALLBACK_EMAIL
+FALLBACK_PASSWORD = config.FALLBACK_PASSWORD
@@ -1,160 +1,798 @@
 """CardDAV tools for contacts management using direct HTTP/WebDAV requests."""
 
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
 import requests
-from requests.auth import HTTPBasicAuth
 import vobject
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from fastmcp import Context
 from .auth import require_auth
-from .config import config
-import xml.etree.ElementTree as ET
-from urllib.parse import urljoin
+from .config import CARDDAV_SERVER, CONTACTS_CACHE_DIR
+from .dav import (
+    MAX_CONCURRENT_REQUESTS, TAG_GETETAG, TAG_HREF, TAG_RESPONSE, TAG_STATUS,
+    UNSUPPORTED_QUERY_STATUSES, XML_PARSER, SessionCache, iter_responses
+)
+from lxml import etree
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from urllib.parse import unquote, urljoin, urlsplit
+from xml.sax.saxutils import escape as xml_escape
 import uuid
 
+# Seconds discovered principal/addressbook URLs stay fresh
+_DISCOVERY_TTL = 3600
+
+# Accounts whose sync state and ETags are kept in memory, least recently used dropped first
+_ACCOUNT_CACHE_SIZE = 32
+
+# Maximum number of CardDAV requests in flight at once (matches the connection pool size)
+_MAX_IN_FLIGHT_REQUESTS = 16
+
+# Statuses iCloud uses for throttling, retried after Retry-After or a backoff delay
+_RETRY_STATUSES = (429, 503)
+_MAX_RETRIES = 5
+_INITIAL_BACKOFF = 1.0
+_MAX_RETRY_DELAY = 60.0
+
+# Status codes meaning cached discovery URLs may no longer be valid
+_STALE_DISCOVERY_STATUSES = (401, 404)
+
+# XML namespaces used in CardDAV responses
+_NS = {'d': 'DAV:', 'card': 'urn:ietf:params:xml:ns:carddav'}
+
+# vCard properties search_contacts matches against
+_SEARCH_PROPERTIES = ('FN', 'EMAIL', 'TEL')
+
+# Status codes meaning a sync token was rejected or sync-collection is unsupported
+_SYNC_UNSUPPORTED_STATUSES = (400, 403, 409, 501)
+
+# Upper bound on follow-up sync-collection requests for truncated (507) results
+_MAX_SYNC_ROUNDS = 50
+
+# Request bodies (PROPFIND/REPORT), pre-encoded without indentation
+_BODY_PRINCIPAL = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b'<d:propfind xmlns:d="DAV:"><d:prop><d:current-user-principal/></d:prop></d:propfind>'
+)
+_BODY_ADDRESSBOOK_HOME = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b'<d:propfind xmlns:d="DAV:" xmlns:card="urn:ietf:params:xml:ns:carddav">'
+    b'<d:prop><card:addressbook-home-set/></d:prop></d:propfind>'
+)
+_BODY_ADDRESSBOOKS = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b'<d:propfind xmlns:d="DAV:" xmlns:card="urn:ietf:params:xml:ns:carddav">'
+    b'<d:prop><d:displayname/><d:resourcetype/><card:addressbook-description/></d:prop></d:propfind>'
+)
+_BODY_ADDRESSBOOK_QUERY = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b'<card:addressbook-query xmlns:d="DAV:" xmlns:card="urn:ietf:params:xml:ns:carddav">'
+    b'<d:prop><d:getetag/><card:address-data/></d:prop>'
+    # addressbook-query requires a filter element; an empty one matches every vCard
+    b'<card:filter/></card:addressbook-query>'
+)
+_BODY_SYNC_TOKEN = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b'<d:propfind xmlns:d="DAV:"><d:prop><d:sync-token/></d:prop></d:propfind>'
+)
+
+# Clark-notation tag of vCard data in a CardDAV multistatus response
+_TAG_ADDRESS_DATA = '{urn:ietf:params:xml:ns:carddav}address-data'
+
+# Compiled XPath queries over CardDAV multistatus responses
+_XP_PRINCIPAL_HREF = etree.XPath('//d:current-user-principal/d:href/text()', namespaces=_NS, smart_strings=False)
+_XP_ADDRESSBOOK_HOME_HREF = etree.XPath('//card:addressbook-home-set/d:href/text()', namespaces=_NS, smart_strings=False)
+_XP_RESPONSES = etree.XPath('//d:response', namespaces=_NS)
+_XP_HREF = etree.XPath('d:href/text()', namespaces=_NS, smart_strings=False)
+_XP_DISPLAYNAME = etree.XPath('.//d:displayname/text()', namespaces=_NS, smart_strings=False)
+_XP_IS_ADDRESSBOOK = etree.XPath('boolean(.//d:resourcetype/card:addressbook)', namespaces=_NS)
+_XP_SYNC_TOKEN = etree.XPath('//d:sync-token/text()', namespaces=_NS, smart_strings=False)
+
+# Properties read from each vCard by the list extractor: optional group
+# prefix (item1.EMAIL), name, parameters (possibly quoted), value
+_VCARD_LINE = re.compile(
+    r'^(?:[A-Za-z0-9-]+\.)?(FN|TEL|EMAIL|ADR)(?:;(?:[^:"\r\n]|"[^"]*")*)?:(.*)$',
+    re.MULTILINE | re.IGNORECASE
+)
+
+# Folded vCard line continuations
+_VCARD_FOLD = re.compile(r'\r?\n[ \t]')
+
+# Single-valued properties update_contact rewrites in place: the first
+# (possibly folded) line, with its group prefix and parameters kept
+_SCALAR_LINES = {
+    prop: re.compile(
+        rf'^((?:[A-Za-z0-9-]+\.)?{prop}(?:;(?:[^:"\r\n]|"[^"]*")*)?):[^\r\n]*(?:\r?\n[ \t][^\r\n]*)*',
+        re.MULTILINE | re.IGNORECASE
+    )
+    for prop in ('FN', 'ORG', 'TITLE')
+}
+
+# Closing line of a vCard, before which missing properties are added
+_VCARD_END = re.compile(r'^END:VCARD', re.MULTILINE | re.IGNORECASE)
+
+# Backslash escapes and separators in vCard TEXT values
+_TEXT_TOKEN = re.compile(r'(\\.?|[,;])', re.DOTALL)
+
+# Characters whose backslash escape is decoded, as in vobject
+_TEXT_ESCAPABLE = '\\;,Nn"'
+
+# ADR component order
+_ADDRESS_ORDER = ('box', 'extended', 'street', 'city', 'region', 'code', 'country')
+
+# vCard count from which list parsing is spread over worker processes
+_PARSE_POOL_THRESHOLD = 500
+
+# Worker processes for vCard parsing
+_PARSE_WORKERS = os.cpu_count() or 1
+
+# Process pool for large vCard batches, created on first use
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+# Keep-alive HTTP sessions per credential pair, so discovery and REPORTs reuse connections
+_sessions = SessionCache(
+    {'Content-Type': 'text/xml; charset=utf-8', 'User-Agent': 'iCloud-MCP/1.0'},
+    pool_maxsize=_MAX_IN_FLIGHT_REQUESTS
+)
+_request_semaphore = asyncio.Semaphore(_MAX_IN_FLIGHT_REQUESTS)
+
+# Addressbook sync state per account email, mirrored to CONTACTS_CACHE_DIR if set:
+# {addressbook_url: {"token": sync_token, "cards": {vcard_url: vcard_entry}}}
+_sync_cache: "OrderedDict[str, Dict[str, Dict[str, Any]]]" = OrderedDict()
+_sync_file_lock = threading.Lock()
+
+# Discovery results per account email: (fetched_at, principal_url, addressbook_home_url, addressbooks)
+_discovery_cache: Dict[str, Tuple[float, str, str, List[Dict[str, str]]]] = {}
+
+# Last seen ETag per account email and contact URL, used as If-Match on delete
+_etag_cache: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+_account_cache_lock = threading.Lock()
+
+
+def _account_entry(cache: "OrderedDict[str, Dict]", email: str, entry: Optional[Dict] = None) -> Optional[Dict]:
+    """
+    Get an account's entry in a per-account LRU cache, storing entry if given and none exists.
+
+    Least recently used accounts are dropped past _ACCOUNT_CACHE_SIZE.
+    """
+    with _account_cache_lock:
+        if email not in cache:
+            if entry is None:
+                return None
+            cache[email] = entry
+        cache.move_to_end(email)
+        while len(cache) > _ACCOUNT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return cache[email]
+
 
 def _get_carddav_session(email: str, password: str) -> tuple:
-    """Create authenticated session for CardDAV (stateless)."""
-    session = requests.Session()
-    session.auth = HTTPBasicAuth(email, password)
-    session.headers.update({
-        'Content-Type': 'text/xml; charset=utf-8',
-        'User-Agent': 'iCloud-MCP/1.0'
-    })
-    return session, email
+    """Get the pooled authenticated CardDAV session for these credentials."""
+    return _sessions.get(email, password), email
 
 
-def _discover_principal(session: requests.Session, base_url: str) -> str:
-    """Discover principal URL for the user."""
-    propfind_body = '''<?xml version="1.0" encoding="UTF-8"?>
-    <d:propfind xmlns:d="DAV:">
-        <d:prop>
-            <d:current-user-principal/>
-        </d:prop>
-    </d:propfind>'''
-    
-    response = session.request('PROPFIND', base_url, data=propfind_body, headers={'Depth': '0'})
+def _retry_delay(response: requests.Response, backoff: float) -> float:
+    """Seconds to wait before retrying a throttled request, from Retry-After if given."""
+    retry_after = response.headers.get('Retry-After', '').strip()
+    if retry_after.isdigit():
+        delay = float(retry_after)
+    elif retry_after:
+        try:
+            delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+        except (TypeError, ValueError):
+            delay = backoff
+    else:
+        delay = backoff
+    return min(max(delay, 0.0), _MAX_RETRY_DELAY)
+
+
+async def _request(session: requests.Session, method: str, url: str, **kwargs: Any) -> requests.Response:
+    """
+    Send a blocking HTTP request in a worker thread and raise on error statuses.
+
+    At most _MAX_IN_FLIGHT_REQUESTS run at once. Throttled responses (429/503)
+    are retried up to _MAX_RETRIES times, honoring Retry-After and otherwise
+    backing off exponentially.
+    """
+    backoff = _INITIAL_BACKOFF
+    for attempt in range(_MAX_RETRIES + 1):
+        async with _request_semaphore:
+            response = await asyncio.to_thread(session.request, method, url, **kwargs)
+        if response.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+            break
+        delay = _retry_delay(response, backoff)
+        response.close()
+        await asyncio.sleep(delay)
+        backoff *= 2
     response.raise_for_status()
+    return response
+
+
+async def _discover_principal(session: requests.Session, base_url: str) -> str:
+    """Discover principal URL for the user."""
+    response = await _request(session, 'PROPFIND', base_url, data=_BODY_PRINCIPAL, headers={'Depth': '0'})
     
     # Parse XML response
-    root = ET.fromstring(response.content)
-    ns = {'d': 'DAV:'}
-    principal_elem = root.find('.//d:current-user-principal/d:href', ns)
+    root = etree.fromstring(response.content, XML_PARSER)
+    principal_hrefs = _XP_PRINCIPAL_HREF(root)
     
-    if principal_elem is not None and principal_elem.text:
-        return urljoin(base_url, principal_elem.text)
+    if principal_hrefs and principal_hrefs[0]:
+        return urljoin(base_url, principal_hrefs[0])
     
     raise ValueError("Could not discover principal URL")
 
 
-def _discover_addressbook_home(session: requests.Session, principal_url: str) -> str:
+async def _discover_addressbook_home(session: requests.Session, principal_url: str) -> str:
     """Discover addressbook home URL."""
-    propfind_body = '''<?xml version="1.0" encoding="UTF-8"?>
-    <d:propfind xmlns:d="DAV:" xmlns:card="urn:ietf:params:xml:ns:carddav">
-        <d:prop>
-            <card:addressbook-home-set/>
-        </d:prop>
-    </d:propfind>'''
-    
-    response = session.request('PROPFIND', principal_url, data=propfind_body, headers={'Depth': '0'})
-    response.raise_for_status()
+    response = await _request(session, 'PROPFIND', principal_url, data=_BODY_ADDRESSBOOK_HOME, headers={'Depth': '0'})
     
     # Parse XML response
-    root = ET.fromstring(response.content)
-    ns = {'d': 'DAV:', 'card': 'urn:ietf:params:xml:ns:carddav'}
-    addressbook_elem = root.find('.//card:addressbook-home-set/d:href', ns)
+    root = etree.fromstring(response.content, XML_PARSER)
+    home_hrefs = _XP_ADDRESSBOOK_HOME_HREF(root)
     
-    if addressbook_elem is not None and addressbook_elem.text:
-        return urljoin(principal_url, addressbook_elem.text)
+    if home_hrefs and home_hrefs[0]:
+        return urljoin(principal_url, home_hrefs[0])
     
     raise ValueError("Could not discover addressbook home URL")
 
 
-def _list_addressbooks(session: requests.Session, addressbook_home_url: str) -> List[Dict[str, str]]:
+async def _list_addressbooks(session: requests.Session, addressbook_home_url: str) -> List[Dict[str, str]]:
     """List all addressbooks."""
-    propfind_body = '''<?xml version="1.0" encoding="UTF-8"?>
-    <d:propfind xmlns:d="DAV:" xmlns:card="urn:ietf:params:xml:ns:carddav">
-        <d:prop>
-            <d:displayname/>
-            <d:resourcetype/>
-            <card:addressbook-description/>
-        </d:prop>
-    </d:propfind>'''
-    
-    response = session.request('PROPFIND', addressbook_home_url, data=propfind_body, headers={'Depth': '1'})
-    response.raise_for_status()
+    response = await _request(session, 'PROPFIND', addressbook_home_url, data=_BODY_ADDRESSBOOKS, headers={'Depth': '1'})
     
     # Parse XML response
-    root = ET.fromstring(response.content)
-    ns = {'d': 'DAV:', 'card': 'urn:ietf:params:xml:ns:carddav'}
+    root = etree.fromstring(response.content, XML_PARSER)
     
+    origin = _url_origin(addressbook_home_url)
     addressbooks = []
-    for response_elem in root.findall('.//d:response', ns):
-        href_elem = response_elem.find('d:href', ns)
-        resourcetype_elem = response_elem.find('.//d:resourcetype', ns)
-        
+    for response_elem in _XP_RESPONSES(root):
         # Check if this is an addressbook
-        if resourcetype_elem is not None and resourcetype_elem.find('card:addressbook', ns) is not None:
-            displayname_elem = response_elem.find('.//d:displayname', ns)
+        if _XP_IS_ADDRESSBOOK(response_elem):
+            hrefs = _XP_HREF(response_elem)
+            displaynames = _XP_DISPLAYNAME(response_elem)
             
             addressbook = {
-                'url': urljoin(addressbook_home_url, href_elem.text) if href_elem is not None else '',
-                'name': displayname_elem.text if displayname_elem is not None and displayname_elem.text else 'Unnamed'
+                'url': _resolve_href(addressbook_home_url, origin, hrefs[0]) if hrefs else '',
+                'name': displaynames[0] if displaynames and displaynames[0] else 'Unnamed'
             }
             addressbooks.append(addressbook)
     
     return addressbooks
 
 
-def _fetch_all_vcards(session: requests.Session, addressbook_url: str) -> List[Dict[str, Any]]:
-    """Fetch all vCards from an addressbook."""
+def _addressbook_query_body(query: Optional[str] = None, limit: Optional[int] = None) -> bytes:
+    """
+    Build an addressbook-query REPORT body.
+
+    With query, only vCards whose name, email or phone contains it match;
+    with limit, the server is asked to return at most that many results.
+    """
+    # addressbook-query requires a filter element; an empty one matches every vCard
+    filter_xml = '<card:filter/>'
+    if query is not None:
+        text_match = (
+            '<card:text-match collation="i;unicode-casemap" match-type="contains">'
+            f'{xml_escape(query)}</card:text-match>'
+        )
+        prop_filters = ''.join(
+            f'<card:prop-filter name="{prop}">{text_match}</card:prop-filter>'
+            for prop in _SEARCH_PROPERTIES
+        )
+        filter_xml = f'<card:filter test="anyof">{prop_filters}</card:filter>'
+    limit_xml = f'<card:limit><card:nresults>{int(limit)}</card:nresults></card:limit>' if limit else ''
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<card:addressbook-query xmlns:d="DAV:" xmlns:card="urn:ietf:params:xml:ns:carddav">'
+        '<d:prop><d:getetag/><card:address-data/></d:prop>'
+        f'{filter_xml}{limit_xml}'
+        '</card:addressbook-query>'
+    ).encode('utf-8')
+
+
+def _addressbook_multiget_body(urls: List[str]) -> bytes:
+    """Build an addressbook-multiget REPORT body for the given vCard URLs."""
+    hrefs = ''.join(f'<d:href>{xml_escape(urlsplit(url).path)}</d:href>' for url in urls)
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<card:addressbook-multiget xmlns:d="DAV:" xmlns:card="urn:ietf:params:xml:ns:carddav">'
+        '<d:prop><d:getetag/><card:address-data/></d:prop>'
+        f'{hrefs}'
+        '</card:addressbook-multiget>'
+    ).encode('utf-8')
+
+
+async def _fetch_all_vcards(
+    session: requests.Session,
+    addressbook_url: str,
+    query: Optional[str] = None,
+    strict: bool = False,
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Fetch all vCards from an addressbook.
+
+    With query, the server only returns vCards whose name, email or phone
+    contains it; servers that can't evaluate the filter raise an HTTPError.
+    With strict, request and parse errors are raised instead of returning
+    what could be read. With limit, the server returns at most that many
+    vCards (the whole addressbook if it can't apply the limit).
+    """
     # Make sure URL ends with /
     if not addressbook_url.endswith('/'):
         addressbook_url += '/'
     
-    query_body = '''<?xml version="1.0" encoding="UTF-8"?>
-    <card:addressbook-query xmlns:d="DAV:" xmlns:card="urn:ietf:params:xml:ns:carddav">
-        <d:prop>
-            <d:getetag/>
-            <card:address-data/>
-        </d:prop>
-    </card:addressbook-query>'''
+    if query is None and not limit:
+        query_body = _BODY_ADDRESSBOOK_QUERY
+    else:
+        query_body = _addressbook_query_body(query, limit)
     
     try:
-        response = session.request('REPORT', addressbook_url, data=query_body, headers={'Depth': '1'})
-        response.raise_for_status()
+        response = await _request(
+            session, 'REPORT', addressbook_url, data=query_body, headers={'Depth': '1'}, stream=True
+        )
     except Exception as e:
+        # Let stale-URL errors through so the caller can drop cached discovery
+        response = getattr(e, 'response', None)
+        if strict or (response is not None and response.status_code in _STALE_DISCOVERY_STATUSES):
+            raise
+        if query is not None and response is not None and response.status_code in UNSUPPORTED_QUERY_STATUSES:
+            raise
+        if limit and response is not None and response.status_code in UNSUPPORTED_QUERY_STATUSES:
+            # Server rejects the limit element: fetch everything and trim client-side
+            return await _fetch_all_vcards(session, addressbook_url, query, strict)
         print(f"Error fetching vCards: {str(e)}")
         return []
     
-    # Parse XML response
+    # The body is read from the socket while parsing, so parse in a worker thread
+    return await asyncio.to_thread(_read_vcards, response, addressbook_url, strict)
+
+
+def _url_origin(url: str) -> str:
+    """Scheme and host part of a URL, e.g. 'https://contacts.icloud.com'."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _resolve_href(base_url: str, origin: str, href: str) -> str:
+    """
+    Resolve a multistatus href against the request URL.
+
+    CardDAV servers report absolute paths, which only need the origin
+    prepended; anything else goes through urljoin.
+    """
+    if href.startswith('/') and not href.startswith('//'):
+        return origin + href
+    if href.startswith(('https://', 'http://')):
+        return href
+    return urljoin(base_url, href)
+
+
+def _descendant_text(elem: Any, tag: str) -> Optional[str]:
+    """Text of the first descendant with this Clark-notation tag, or None."""
+    for child in elem.iter(tag):
+        return child.text
+    return None
+
+
+def _read_vcards(response: requests.Response, addressbook_url: str, strict: bool = False) -> List[Dict[str, Any]]:
+    """
+    Stream-parse an addressbook REPORT response into vCard entries.
+
+    Each response element is discarded once read, so only one entry of a
+    large multistatus body is held in memory at a time.
+    """
+    origin = _url_origin(addressbook_url)
     vcards = []
     try:
-        root = ET.fromstring(response.content)
-        ns = {'d': 'DAV:', 'card': 'urn:ietf:params:xml:ns:carddav'}
-        
-        for response_elem in root.findall('.//d:response', ns):
-            href_elem = response_elem.find('d:href', ns)
-            vcard_data_elem = response_elem.find('.//card:address-data', ns)
-            etag_elem = response_elem.find('.//d:getetag', ns)
+        for response_elem in iter_responses(response):
+            vcard_data = _descendant_text(response_elem, _TAG_ADDRESS_DATA)
             
-            if vcard_data_elem is not None and vcard_data_elem.text:
+            if vcard_data:
+                href = response_elem.findtext(TAG_HREF)
                 vcards.append({
-                    'url': urljoin(addressbook_url, href_elem.text) if href_elem is not None else '',
-                    'data': vcard_data_elem.text,
-                    'etag': etag_elem.text if etag_elem is not None else ''
+                    'url': _resolve_href(addressbook_url, origin, href) if href else '',
+                    'data': vcard_data,
+                    'etag': _descendant_text(response_elem, TAG_GETETAG) or ''
                 })
     except Exception as e:
+        if strict:
+            raise
         print(f"Error parsing vCards: {str(e)}")
     
     return vcards
 
 
+def _sync_cache_path(email: str) -> Optional[str]:
+    """Path of the account's on-disk sync cache, or None when persistence is off."""
+    if not CONTACTS_CACHE_DIR:
+        return None
+    name = hashlib.sha256(email.encode('utf-8')).hexdigest()[:32]
+    return os.path.join(os.path.expanduser(CONTACTS_CACHE_DIR), f"contacts-{name}.json")
+
+
+def _load_sync_state(email: str) -> Dict[str, Dict[str, Any]]:
+    """Load the account's sync state from disk into memory (empty if missing or unreadable)."""
+    state = _account_entry(_sync_cache, email)
+    if state is not None:
+        return state
+    
+    state = {}
+    path = _sync_cache_path(email)
+    if path and os.path.exists(path):
+        try:
+            with open(path, encoding='utf-8') as f:
+                state = json.load(f)
+        except Exception as e:
+            print(f"Error reading contacts cache: {str(e)}")
+            state = {}
+    return _account_entry(_sync_cache, email, state)
+
+
+def _save_sync_state(email: str, state: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Write a snapshot of the account's sync state to disk, readable by the owner only.
+
+    The snapshot's dicts must not be shared with _sync_cache, which the event
+    loop may keep updating while this runs in a worker thread.
+    """
+    path = _sync_cache_path(email)
+    if not path:
+        return
+    try:
+        with _sync_file_lock:
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"Error writing contacts cache: {str(e)}")
+
+
+def _snapshot_sync_state(state: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Copy sync state deep enough to be serialized while the original changes."""
+    return {
+        url: {'token': book['token'], 'cards': dict(book['cards'])}
+        for url, book in state.items()
+    }
+
+
+async def _fetch_sync_token(session: requests.Session, addressbook_url: str) -> Optional[str]:
+    """Get the addressbook's current sync token (None if the server has none)."""
+    try:
+        response = await _request(session, 'PROPFIND', addressbook_url, data=_BODY_SYNC_TOKEN, headers={'Depth': '0'})
+        tokens = _XP_SYNC_TOKEN(etree.fromstring(response.content, XML_PARSER))
+    except Exception as e:
+        print(f"Error fetching sync token: {str(e)}")
+        return None
+    return tokens[0] if tokens and tokens[0] else None
+
+
+async def _sync_changes(
+    session: requests.Session,
+    addressbook_url: str,
+    token: str
+) -> Tuple[str, Dict[str, Optional[Dict[str, Any]]]]:
+    """
+    Fetch vCards changed since a sync token with sync-collection (RFC 6578).
+
+    Returns:
+        (new sync token, {vcard_url: vcard entry, or None if it was removed})
+    """
+    origin = _url_origin(addressbook_url)
+    changes: Dict[str, Optional[Dict[str, Any]]] = {}
+    for _ in range(_MAX_SYNC_ROUNDS):
+        sync_body = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<d:sync-collection xmlns:d="DAV:" xmlns:card="urn:ietf:params:xml:ns:carddav">'
+            f'<d:sync-token>{xml_escape(token)}</d:sync-token>'
+            '<d:sync-level>1</d:sync-level>'
+            '<d:prop><d:getetag/><card:address-data/></d:prop>'
+            '</d:sync-collection>'
+        ).encode('utf-8')
+        
+        response = await _request(session, 'REPORT', addressbook_url, data=sync_body, headers={'Depth': '1'})
+        root = etree.fromstring(response.content, XML_PARSER)
+        
+        truncated = False
+        for response_elem in root.iter(TAG_RESPONSE):
+            href = response_elem.findtext(TAG_HREF)
+            if not href:
+                continue
+            url = _resolve_href(addressbook_url, origin, href)
+            status = response_elem.findtext(TAG_STATUS) or ''
+            
+            if url.rstrip('/') == addressbook_url.rstrip('/'):
+                # The collection itself is only reported when results were truncated
+                truncated = ' 507' in status
+            elif ' 404' in status:
+                changes[url] = None
+            else:
+                vcard_data = _descendant_text(response_elem, _TAG_ADDRESS_DATA)
+                if not vcard_data:
+                    raise ValueError(f"Server returned no vCard data for {url}")
+                changes[url] = {
+                    'url': url,
+                    'data': vcard_data,
+                    'etag': _descendant_text(response_elem, TAG_GETETAG) or ''
+                }
+        
+        new_tokens = _XP_SYNC_TOKEN(root)
+        if not new_tokens or not new_tokens[0]:
+            raise ValueError("Server returned no sync token")
+        token = new_tokens[0]
+        if not truncated:
+            break
+    
+    return token, changes
+
+
+def _has_sync_state(email: str, addressbook_url: str) -> bool:
+    """Whether an addressbook already has vCards cached in memory for incremental sync."""
+    if not addressbook_url.endswith('/'):
+        addressbook_url += '/'
+    return addressbook_url in _sync_cache.get(email, {})
+
+
+async def _sync_vcards(session: requests.Session, email: str, addressbook_url: str) -> List[Dict[str, Any]]:
+    """
+    Get all vCards of an addressbook, downloading only what changed since the last call.
+
+    The first call does a full fetch and remembers the sync token; later
+    calls apply sync-collection changes to the cached vCards. Rejected
+    tokens and servers without sync support fall back to a full fetch.
+    """
+    if not addressbook_url.endswith('/'):
+        addressbook_url += '/'
+    
+    state = await asyncio.to_thread(_load_sync_state, email)
+    book = state.get(addressbook_url)
+    
+    if book:
+        try:
+            token, changes = await _sync_changes(session, addressbook_url, book['token'])
+        except Exception as e:
+            response = getattr(e, 'response', None)
+            if response is not None and response.status_code in _STALE_DISCOVERY_STATUSES:
+                raise
+            if response is None or response.status_code not in _SYNC_UNSUPPORTED_STATUSES:
+                print(f"Error syncing vCards: {str(e)}")
+            state.pop(addressbook_url, None)
+        else:
+            cards = book['cards']
+            for url, vcard in changes.items():
+                if vcard is None:
+                    cards.pop(url, None)
+                else:
+                    cards[url] = vcard
+            if changes or token != book['token']:
+                book['token'] = token
+                await asyncio.to_thread(_save_sync_state, email, _snapshot_sync_state(state))
+            return list(cards.values())
+    
+    # Full fetch; the token is read first so changes made meanwhile are synced next time
+    token = await _fetch_sync_token(session, addressbook_url)
+    if not token:
+        return await _fetch_all_vcards(session, addressbook_url)
+    
+    try:
+        vcards = await _fetch_all_vcards(session, addressbook_url, strict=True)
+    except Exception as e:
+        response = getattr(e, 'response', None)
+        if response is not None and response.status_code in _STALE_DISCOVERY_STATUSES:
+            raise
+        print(f"Error fetching vCards: {str(e)}")
+        return []
+    
+    state[addressbook_url] = {'token': token, 'cards': {vcard['url']: vcard for vcard in vcards}}
+    await asyncio.to_thread(_save_sync_state, email, _snapshot_sync_state(state))
+    return vcards
+
+
+async def _get_addressbooks(session: requests.Session, email: str) -> List[Dict[str, str]]:
+    """List the account's addressbooks, reusing discovery results while fresh."""
+    cached = _discovery_cache.get(email)
+    if cached and time.monotonic() - cached[0] < _DISCOVERY_TTL:
+        return cached[3]
+
+    base_url = CARDDAV_SERVER
+    principal_url = await _discover_principal(session, base_url)
+    addressbook_home_url = await _discover_addressbook_home(session, principal_url)
+    addressbooks = await _list_addressbooks(session, addressbook_home_url)
+
+    _discovery_cache[email] = (time.monotonic(), principal_url, addressbook_home_url, addressbooks)
+    return addressbooks
+
+
+def _remember_etags(email: str, vcards: List[Dict[str, Any]]) -> None:
+    """Record the ETags of fetched vCards so later writes can be conditional."""
+    etags = _account_entry(_etag_cache, email, {})
+    for vcard in vcards:
+        if vcard['url'] and vcard['etag']:
+            etags[vcard['url']] = vcard['etag']
+
+
+def _remember_etag(email: str, contact_url: str, response: requests.Response) -> None:
+    """Record the ETag a GET or PUT response reports for a contact, if any."""
+    etag = response.headers.get('ETag')
+    if etag:
+        _account_entry(_etag_cache, email, {})[contact_url] = etag
+    else:
+        _etag_cache.get(email, {}).pop(contact_url, None)
+
+
+def _forget_discovery(email: str, error: Exception) -> None:
+    """Drop cached discovery results if the error suggests they are stale."""
+    response = getattr(error, 'response', None)
+    if response is not None and response.status_code in _STALE_DISCOVERY_STATUSES:
+        _discovery_cache.pop(email, None)
+
+
+def _text_values(value: str, separator: str = ',', escapable: str = _TEXT_ESCAPABLE) -> List[str]:
+    """Split a vCard TEXT value on unescaped separators and decode escapes (like vobject)."""
+    values = []
+    current = []
+    for token in _TEXT_TOKEN.split(value):
+        if not token:
+            continue
+        if token == separator:
+            values.append(''.join(current))
+            current = []
+        elif token[0] == '\\':
+            char = token[1:]
+            if char and char in escapable:
+                current.append('\n' if char in 'nN' else char)
+            else:
+                # Unknown escapes are left for a later pass
+                current.append(token)
+        else:
+            current.append(token)
+    # A trailing separator doesn't start another value
+    if current or not values:
+        values.append(''.join(current))
+    return values
+
+
+def _format_address(value: str) -> str:
+    """Render a raw ADR value the way str(vobject.vcard.Address) does."""
+    fields = {}
+    for name, field in zip(_ADDRESS_ORDER, _text_values(value, ';', ';')):
+        parts = _text_values(field)
+        fields[name] = parts[0] if len(parts) == 1 else parts
+
+    def join(name: str, join_char: str = '\n') -> str:
+        field = fields.get(name, '')
+        return join_char.join(field) if isinstance(field, list) else field
+
+    lines = '\n'.join(join(name) for name in ('box', 'extended', 'street') if fields.get(name))
+    lines += f"\n{join('city', ' ')}, {join('region', ' ')} {join('code', ' ')}"
+    if fields.get('country'):
+        lines += '\n' + join('country')
+    return lines
+
+
+def _extract_contact(vcard_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a list-view contact dict by scanning the raw vCard lines."""
+    contact = {
+        "id": vcard_data['url'],
+        "name": "",
+        "phones": [],
+        "emails": [],
+        "addresses": [],
+        "url": vcard_data['url']
+    }
+    
+    name_seen = False
+    for prop, value in _VCARD_LINE.findall(_VCARD_FOLD.sub('', vcard_data['data'])):
+        value = value.rstrip('\r')
+        prop = prop.upper()
+        if prop == 'ADR':
+            contact["addresses"].append(_format_address(value))
+            continue
+        
+        # Single-valued text: the first list item, as vobject decodes it
+        text = _text_values(value)[0]
+        if prop == 'FN':
+            if not name_seen:
+                name_seen = True
+                contact["name"] = text
+        elif text:
+            contact["phones" if prop == 'TEL' else "emails"].append(text)
+    
+    return contact
+
+
+def _parse_vcards(
+    vcards: List[Dict[str, Any]],
+    limit: Optional[int] = None,
+    search_blob: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Build contact dicts from fetched vCards, skipping empty and unparseable entries.
+
+    With search_blob, each contact also gets a "_search_blob" key holding its
+    lowercased name, phones and emails, for a single substring test per query.
+    """
+    result = []
+    count = 0
+    
+    for vcard_data in vcards:
+        if limit and count >= limit:
+            break
+        
+        try:
+            contact = _extract_contact(vcard_data)
+            
+            # Only add contact if it has a name or at least one other field
+            if contact["name"] or contact["phones"] or contact["emails"]:
+                if search_blob:
+                    # NUL-separated so a match can't span two fields
+                    contact["_search_blob"] = "\0".join(
+                        [contact["name"], *contact["phones"], *contact["emails"]]
+                    ).lower()
+                result.append(contact)
+                count += 1
+        
+        except Exception as e:
+            print(f"Error parsing vCard: {str(e)}")
+            continue
+    
+    return result
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Get the vCard parsing process pool, starting it on first use."""
+    global _parse_pool
+    if _parse_pool is None:
+        # Never fork this multi-threaded process: a child could inherit a lock
+        # held by another thread (e.g. stdout's) and deadlock on it
+        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=_PARSE_WORKERS, mp_context=multiprocessing.get_context(start_method)
+        )
+    return _parse_pool
+
+
+async def _parse_vcards_off_loop(
+    vcards: List[Dict[str, Any]],
+    limit: Optional[int] = None,
+    search_blob: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Run _parse_vcards without blocking the event loop.
+
+    Small batches are parsed in a worker thread; large ones are split across
+    worker processes so parsing isn't serialized by the GIL.
+    """
+    if len(vcards) < _PARSE_POOL_THRESHOLD or _PARSE_WORKERS == 1:
+        return await asyncio.to_thread(_parse_vcards, vcards, limit, search_blob)
+    
+    loop = asyncio.get_running_loop()
+    pool = _get_parse_pool()
+    size = -(-len(vcards) // _PARSE_WORKERS)
+    batches = [vcards[i:i + size] for i in range(0, len(vcards), size)]
+    results = await asyncio.gather(*(loop.run_in_executor(pool, _parse_vcards, batch, None, search_blob) for batch in batches))
+    
+    # Batches are parsed whole, so apply the limit once they are joined
+    contacts = list(chain.from_iterable(results))
+    return contacts[:limit] if limit else contacts
+
+
 async def list_contacts(
     context: Context,
     limit: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     """
-    List all contacts.
+    List all contacts from every addressbook.
 
     Args:
         limit: Maximum number of contacts to return (optional)
@@ -167,82 +805,227 @@ async def list_contacts(
     
     try:
         # Discover URLs
-        base_url = config.CARDDAV_SERVER
-        principal_url = _discover_principal(session, base_url)
-        addressbook_home_url = _discover_addressbook_home(session, principal_url)
-        addressbooks = _list_addressbooks(session, addressbook_home_url)
+        addressbooks = await _get_addressbooks(session, email)
         
         if not addressbooks:
             return []
         
-        # Use first addressbook
-        addressbook_url = addressbooks[0]['url']
+        # Fetch all vCards from every addressbook concurrently
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
         
-        # Fetch all vCards
-        vcards = _fetch_all_vcards(session, addressbook_url)
+        async def fetch(addressbook: Dict[str, str], limited: bool) -> List[Dict[str, Any]]:
+            async with semaphore:
+                if limited:
+                    return await _fetch_all_vcards(session, addressbook['url'], limit=limit)
+                return await _sync_vcards(session, email, addressbook['url'])
         
-        # Parse vCards
-        result = []
-        count = 0
+        # Without a synced copy, a limited listing only downloads what it needs
+        limited = [bool(limit) and not _has_sync_state(email, addressbook['url']) for addressbook in addressbooks]
+        results = list(await asyncio.gather(
+            *(fetch(addressbook, is_limited) for addressbook, is_limited in zip(addressbooks, limited))
+        ))
+        vcards = list(chain.from_iterable(results))
+        contacts = await _parse_vcards_off_loop(vcards, limit)
         
-        for vcard_data in vcards:
-            if limit and count >= limit:
-                break
-            
-            try:
-                vcard = vobject.readOne(vcard_data['data'])
-                
-                contact = {
-                    "id": vcard_data['url'],
-                    "name": "",
-                    "phones": [],
-                    "emails": [],
-                    "addresses": [],
-                    "url": vcard_data['url']
-                }
-                
-                # Extract name
-                if hasattr(vcard, 'fn') and vcard.fn and hasattr(vcard.fn, 'value'):
-                    contact["name"] = str(vcard.fn.value)
-                
-                # Extract phone numbers
-                if hasattr(vcard, 'tel_list'):
-                    for tel in vcard.tel_list:
-                        if hasattr(tel, 'value') and tel.value:
-                            contact["phones"].append(str(tel.value))
-                
-                # Extract emails
-                if hasattr(vcard, 'email_list'):
-                    for em in vcard.email_list:
-                        if hasattr(em, 'value') and em.value:
-                            contact["emails"].append(str(em.value))
-                
-                # Extract addresses
-                if hasattr(vcard, 'adr_list'):
-                    for adr in vcard.adr_list:
-                        if hasattr(adr, 'value'):
-                            try:
-                                addr_str = str(adr.value) if adr.value else ""
-                                if addr_str:
-                                    contact["addresses"].append(addr_str)
-                            except Exception as _e:
-                                continue
-                
-                # Only add contact if it has a name or at least one other field
-                if contact["name"] or contact["phones"] or contact["emails"]:
-                    result.append(contact)
-                    count += 1
-            
-            except Exception as e:
-                print(f"Error parsing vCard: {str(e)}")
-                continue
+        if limit and len(contacts) < limit:
+            # Empty vCards are skipped, so an addressbook cut off at the limit
+            # may still hold contacts: fetch those in full and parse again
+            truncated = [i for i, is_limited in enumerate(limited) if is_limited and len(results[i]) == limit]
+            if truncated:
+                refetched = await asyncio.gather(*(fetch(addressbooks[i], False) for i in truncated))
+                for i, result in zip(truncated, refetched):
+                    results[i] = result
+                vcards = list(chain.from_iterable(results))
+                contacts = await _parse_vcards_off_loop(vcards, limit)
         
-        return result
+        _remember_etags(email, vcards)
+        return contacts
     
     except Exception as e:
+        _forget_discovery(email, e)
         raise ValueError(f"Failed to list contacts: {str(e)}")
 
 
+def _contact_details(vcard_text: str, contact_id: str) -> Dict[str, Any]:
+    """Parse a full vCard into the contact details returned by get_contact."""
+    # Read properties straight from contents; vobject attribute lookups raise on misses
+    contents = vobject.readOne(vcard_text).contents
+    fn = contents.get('fn')
+    org = contents.get('org')
+    title = contents.get('title')
+    
+    return {
+        "id": contact_id,
+        "name": str(fn[0].value) if fn else "",
+        "phones": [str(tel.value) for tel in contents.get('tel', ())],
+        "emails": [str(em.value) for em in contents.get('email', ())],
+        "addresses": [str(adr.value) for adr in contents.get('adr', ())],
+        "organization": str(org[0].value[0]) if org and org[0].value else "",
+        "title": str(title[0].value) if title else "",
+        "url": contact_id
+    }
+
+
+def _build_vcard(
+    name: str,
+    phones: Optional[List[str]],
+    emails: Optional[List[str]],
+    addresses: Optional[List[str]],
+    organization: Optional[str],
+    title: Optional[str]
+) -> Tuple[bytes, str]:
+    """Build a new vCard and return its UTF-8 serialization and UID."""
+    # Create vCard
+    vcard = vobject.vCard()
+    vcard.add('fn').value = name
+    vcard.add('n').value = vobject.vcard.Name(family='', given=name)
+    
+    # Generate unique UID
+    unique_id = str(uuid.uuid4())
+    vcard.add('uid').value = unique_id
+    
+    # Add phones
+    if phones:
+        for phone in phones:
+            tel = vcard.add('tel')
+            tel.value = phone
+            tel.type_param = 'CELL'
+    
+    # Add emails
+    if emails:
+        for em in emails:
+            email_obj = vcard.add('email')
+            email_obj.value = em
+            email_obj.type_param = 'INTERNET'
+    
+    # Add addresses
+    if addresses:
+        for addr in addresses:
+            adr = vcard.add('adr')
+            adr.value = vobject.vcard.Address(street=addr)
+    
+    # Add organization
+    if organization:
+        vcard.add('org').value = [organization]
+    
+    # Add title
+    if title:
+        vcard.add('title').value = title
+    
+    # Serialize vCard
+    return vcard.serialize().encode('utf-8'), unique_id
+
+
+def _escape_text(value: str) -> str:
+    """Escape a vCard TEXT value the way vobject serializes it."""
+    return (
+        value.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+        .replace('\r\n', '\\n').replace('\n', '\\n')
+    )
+
+
+def _patch_vcard_scalars(
+    vcard_text: str,
+    name: Optional[str],
+    organization: Optional[str],
+    title: Optional[str]
+) -> Optional[Tuple[bytes, str]]:
+    """
+    Rewrite FN, ORG and TITLE lines of a raw vCard without parsing it.
+
+    Returns the UTF-8 vCard and its full name like _update_vcard, or None
+    if the vCard doesn't look complete enough to edit textually.
+    """
+    if _VCARD_END.search(vcard_text) is None:
+        return None
+    newline = '\r\n' if '\r\n' in vcard_text else '\n'
+    
+    updates = {'FN': name or None, 'ORG': organization, 'TITLE': title}
+    for prop, value in updates.items():
+        if value is None:
+            continue
+        escaped = _escape_text(value)
+        vcard_text, count = _SCALAR_LINES[prop].subn(
+            lambda match: f"{match.group(1)}:{escaped}", vcard_text, count=1
+        )
+        if not count:
+            end = _VCARD_END.search(vcard_text)
+            vcard_text = f"{vcard_text[:end.start()]}{prop}:{escaped}{newline}{vcard_text[end.start():]}"
+    
+    if name:
+        full_name = name
+    else:
+        fn = _SCALAR_LINES['FN'].search(vcard_text)
+        full_name = ''
+        if fn:
+            value = _VCARD_FOLD.sub('', fn.group(0))[len(fn.group(1)) + 1:]
+            full_name = _text_values(value)[0]
+    return vcard_text.encode('utf-8'), full_name
+
+
+def _update_vcard(
+    vcard_text: str,
+    name: Optional[str],
+    phones: Optional[List[str]],
+    emails: Optional[List[str]],
+    addresses: Optional[List[str]],
+    organization: Optional[str],
+    title: Optional[str]
+) -> Tuple[bytes, str]:
+    """Apply contact changes to a vCard; return its UTF-8 serialization and full name."""
+    vcard = vobject.readOne(vcard_text)
+    contents = vcard.contents
+    
+    # Update fields
+    if name:
+        if 'fn' in contents:
+            contents['fn'][0].value = name
+        else:
+            vcard.add('fn').value = name
+    
+    if phones is not None:
+        # Remove existing phones
+        contents.pop('tel', None)
+        # Add new phones
+        for phone in phones:
+            tel = vcard.add('tel')
+            tel.value = phone
+            tel.type_param = 'CELL'
+    
+    if emails is not None:
+        # Remove existing emails
+        contents.pop('email', None)
+        # Add new emails
+        for em in emails:
+            email_obj = vcard.add('email')
+            email_obj.value = em
+            email_obj.type_param = 'INTERNET'
+    
+    if addresses is not None:
+        # Remove existing addresses
+        contents.pop('adr', None)
+        # Add new addresses
+        for addr in addresses:
+            adr = vcard.add('adr')
+            adr.value = vobject.vcard.Address(street=addr)
+    
+    if organization is not None:
+        if 'org' in contents:
+            contents['org'][0].value = [organization]
+        else:
+            vcard.add('org').value = [organization]
+    
+    if title is not None:
+        if 'title' in contents:
+            contents['title'][0].value = title
+        else:
+            vcard.add('title').value = title
+    
+    fn = contents.get('fn')
+    full_name = str(fn[0].value) if fn else ""
+    return vcard.serialize().encode('utf-8'), full_name
+
+
 async def get_contact(context: Context, contact_id: str) -> Dict[str, Any]:
     """
     Get a specific contact by ID.
@@ -257,43 +1040,75 @@ async def get_contact(context: Context, contact_id: str) -> Dict[str, Any]:
     session, _ = _get_carddav_session(email, password)
     
     try:
-        response = session.get(contact_id)
-        response.raise_for_status()
-        
-        vcard = vobject.readOne(response.text)
+        response = await _request(session, 'GET', contact_id)
+        _remember_etag(email, contact_id, response)
         
-        contact = {
-            "id": contact_id,
-            "name": str(vcard.fn.value) if hasattr(vcard, 'fn') else "",
-            "phones": [],
-            "emails": [],
-            "addresses": [],
-            "organization": str(vcard.org.value[0]) if hasattr(vcard, 'org') and vcard.org.value else "",
-            "title": str(vcard.title.value) if hasattr(vcard, 'title') else "",
-            "url": contact_id
-        }
-        
-        # Extract phone numbers
-        if hasattr(vcard, 'tel_list'):
-            for tel in vcard.tel_list:
-                contact["phones"].append(str(tel.value))
-        
-        # Extract emails
-        if hasattr(vcard, 'email_list'):
-            for em in vcard.email_list:
-                contact["emails"].append(str(em.value))
-        
-        # Extract addresses
-        if hasattr(vcard, 'adr_list'):
-            for adr in vcard.adr_list:
-                contact["addresses"].append(str(adr.value))
-        
-        return contact
+        # vobject parsing is CPU-bound, so keep it off the event loop
+        return await asyncio.to_thread(_contact_details, response.text, contact_id)
     
     except Exception as e:
         raise ValueError(f"Failed to get contact: {str(e)}")
 
 
+async def get_contacts(context: Context, contact_ids: List[str]) -> List[Dict[str, Any]]:
+    """
+    Get several contacts by ID.
+
+    Contacts are loaded with one addressbook-multiget REPORT per addressbook.
+
+    Args:
+        contact_ids: Contact URLs/IDs
+
+    Returns:
+        Contact details in the order requested, or {"id", "error"} for each
+        contact that could not be loaded
+    """
+    email, password = require_auth(context)
+    session, _ = _get_carddav_session(email, password)
+    
+    # Group contact URLs by their addressbook collection
+    by_addressbook: Dict[str, List[str]] = {}
+    for contact_id in dict.fromkeys(contact_ids):
+        by_addressbook.setdefault(contact_id.rsplit('/', 1)[0] + '/', []).append(contact_id)
+    
+    async def fetch(addressbook_url: str, urls: List[str]) -> List[Dict[str, Any]]:
+        response = await _request(
+            session, 'REPORT', addressbook_url,
+            data=_addressbook_multiget_body(urls), headers={'Depth': '1'}, stream=True
+        )
+        return await asyncio.to_thread(_read_vcards, response, addressbook_url, True)
+    
+    groups = list(by_addressbook.items())
+    results = await asyncio.gather(*(fetch(url, urls) for url, urls in groups), return_exceptions=True)
+    
+    loaded: Dict[str, Dict[str, Any]] = {}
+    errors: Dict[str, str] = {}
+    for (_, urls), result in zip(groups, results):
+        if isinstance(result, BaseException):
+            for url in urls:
+                errors[url] = f"Failed to get contact: {str(result)}"
+        else:
+            _remember_etags(email, result)
+            for vcard in result:
+                loaded[unquote(vcard['url'])] = vcard
+    
+    def parse() -> List[Dict[str, Any]]:
+        contacts = []
+        for contact_id in contact_ids:
+            vcard = loaded.get(unquote(contact_id))
+            if vcard is None:
+                contacts.append({"id": contact_id, "error": errors.get(contact_id, "Contact not found")})
+                continue
+            try:
+                contacts.append(_contact_details(vcard['data'], contact_id))
+            except Exception as e:
+                contacts.append({"id": contact_id, "error": f"Failed to parse contact: {str(e)}"})
+        return contacts
+    
+    # vobject parsing is CPU-bound, so keep it off the event loop
+    return await asyncio.to_thread(parse)
+
+
 async def create_contact(
     context: Context,
     name: str,
@@ -322,10 +1137,7 @@ async def create_contact(
     
     try:
         # Discover URLs
-        base_url = config.CARDDAV_SERVER
-        principal_url = _discover_principal(session, base_url)
-        addressbook_home_url = _discover_addressbook_home(session, principal_url)
-        addressbooks = _list_addressbooks(session, addressbook_home_url)
+        addressbooks = await _get_addressbooks(session, email)
         
         if not addressbooks:
             raise ValueError("No addressbooks found")
@@ -334,55 +1146,20 @@ async def create_contact(
         if not addressbook_url.endswith('/'):
             addressbook_url += '/'
         
-        # Create vCard
-        vcard = vobject.vCard()
-        vcard.add('fn').value = name
-        vcard.add('n').value = vobject.vcard.Name(family='', given=name)
-        
-        # Generate unique UID
-        unique_id = str(uuid.uuid4())
-        vcard.add('uid').value = unique_id
-        
-        # Add phones
-        if phones:
-            for phone in phones:
-                tel = vcard.add('tel')
-                tel.value = phone
-                tel.type_param = 'CELL'
-        
-        # Add emails
-        if emails:
-            for em in emails:
-                email_obj = vcard.add('email')
-                email_obj.value = em
-                email_obj.type_param = 'INTERNET'
-        
-        # Add addresses
-        if addresses:
-            for addr in addresses:
-                adr = vcard.add('adr')
-                adr.value = vobject.vcard.Address(street=addr)
-        
-        # Add organization
-        if organization:
-            vcard.add('org').value = [organization]
-        
-        # Add title
-        if title:
-            vcard.add('title').value = title
-        
-        # Serialize vCard
-        vcard_data = vcard.serialize()
+        # Build and serialize the vCard in a worker thread
+        vcard_data, unique_id = await asyncio.to_thread(
+            _build_vcard, name, phones, emails, addresses, organization, title
+        )
         
         # PUT vCard to server
         contact_url = f"{addressbook_url}{unique_id}.vcf"
         
-        response = session.put(
-            contact_url,
+        response = await _request(
+            session, 'PUT', contact_url,
             data=vcard_data,
             headers={'Content-Type': 'text/vcard; charset=utf-8'}
         )
-        response.raise_for_status()
+        _remember_etag(email, contact_url, response)
         
         return {
             "id": contact_url,
@@ -396,6 +1173,7 @@ async def create_contact(
         }
     
     except Exception as e:
+        _forget_discovery(email, e)
         raise ValueError(f"Failed to create contact: {str(e)}")
 
 
@@ -429,73 +1207,32 @@ async def update_contact(
     
     try:
         # Get existing vCard
-        response = session.get(contact_id)
-        response.raise_for_status()
+        response = await _request(session, 'GET', contact_id)
         etag = response.headers.get('ETag', '')
         
-        vcard = vobject.readOne(response.text)
-        
-        # Update fields
-        if name:
-            vcard.fn.value = name
-        
-        if phones is not None:
-            # Remove existing phones
-            if hasattr(vcard, 'tel_list'):
-                for tel in list(vcard.tel_list):
-                    vcard.remove(tel)
-            # Add new phones
-            for phone in phones:
-                tel = vcard.add('tel')
-                tel.value = phone
-                tel.type_param = 'CELL'
-        
-        if emails is not None:
-            # Remove existing emails
-            if hasattr(vcard, 'email_list'):
-                for em in list(vcard.email_list):
-                    vcard.remove(em)
-            # Add new emails
-            for em in emails:
-                email_obj = vcard.add('email')
-                email_obj.value = em
-                email_obj.type_param = 'INTERNET'
-        
-        if addresses is not None:
-            # Remove existing addresses
-            if hasattr(vcard, 'adr_list'):
-                for adr in list(vcard.adr_list):
-                    vcard.remove(adr)
-            # Add new addresses
-            for addr in addresses:
-                adr = vcard.add('adr')
-                adr.value = vobject.vcard.Address(street=addr)
-        
-        if organization is not None:
-            if hasattr(vcard, 'org'):
-                vcard.org.value = [organization]
-            else:
-                vcard.add('org').value = [organization]
-        
-        if title is not None:
-            if hasattr(vcard, 'title'):
-                vcard.title.value = title
-            else:
-                vcard.add('title').value = title
+        # Scalar-only edits rewrite the affected lines in place, skipping vobject
+        patched = None
+        if phones is None and emails is None and addresses is None:
+            patched = _patch_vcard_scalars(response.text, name, organization, title)
         
-        # Serialize and PUT back
-        vcard_data = vcard.serialize()
+        if patched is not None:
+            vcard_data, full_name = patched
+        else:
+            # Parse, modify and serialize the vCard in a worker thread
+            vcard_data, full_name = await asyncio.to_thread(
+                _update_vcard, response.text, name, phones, emails, addresses, organization, title
+            )
         
         headers = {'Content-Type': 'text/vcard; charset=utf-8'}
         if etag:
             headers['If-Match'] = etag
         
-        response = session.put(contact_id, data=vcard_data, headers=headers)
-        response.raise_for_status()
+        response = await _request(session, 'PUT', contact_id, data=vcard_data, headers=headers)
+        _remember_etag(email, contact_id, response)
         
         return {
             "id": contact_id,
-            "name": str(vcard.fn.value) if hasattr(vcard, 'fn') else "",
+            "name": full_name,
             "phones": phones if phones is not None else [],
             "emails": emails if emails is not None else [],
             "addresses": addresses if addresses is not None else [],
@@ -521,12 +1258,26 @@ async def delete_contact(context: Context, contact_id: str) -> Dict[str, str]:
     email, password = require_auth(context)
     session, _ = _get_carddav_session(email, password)
     
+    # A single conditional DELETE: no discovery and no vCard download
+    etags = _etag_cache.get(email, {})
+    etag = etags.get(contact_id)
+    headers = {'If-Match': etag} if etag else {}
+    
     try:
-        response = session.delete(contact_id)
-        response.raise_for_status()
+        await _request(session, 'DELETE', contact_id, headers=headers)
+        etags.pop(contact_id, None)
         
         return {"status": "success", "message": f"Contact {contact_id} deleted"}
     
+    except requests.HTTPError as e:
+        if e.response is not None and e.response.status_code == 412:
+            # The cached ETag is outdated; the next attempt reads a fresh one
+            etags.pop(contact_id, None)
+            raise ValueError(
+                f"Failed to delete contact: {contact_id} was modified since it was last read"
+            )
+        raise ValueError(f"Failed to delete contact: {str(e)}")
+    
     except Exception as e:
         raise ValueError(f"Failed to delete contact: {str(e)}")
 
@@ -544,16 +1295,43 @@ async def search_contacts(
     Returns:
         List of matching contacts
     """
-    # Get all contacts
-    contacts = await list_contacts(context)
+    email, password = require_auth(context)
+    session, _ = _get_carddav_session(email, password)
+    
+    try:
+        addressbooks = await _get_addressbooks(session, email)
+        
+        if not addressbooks:
+            return []
+        
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        async def search(addressbook: Dict[str, str]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    # Let the server filter, so only matching vCards are downloaded
+                    return await _fetch_all_vcards(session, addressbook['url'], query)
+                except requests.HTTPError as e:
+                    if e.response is None or e.response.status_code not in UNSUPPORTED_QUERY_STATUSES:
+                        raise
+                    # Server can't evaluate the filter: scan the whole addressbook
+                    return await _fetch_all_vcards(session, addressbook['url'])
+        
+        results = await asyncio.gather(*(search(addressbook) for addressbook in addressbooks))
+        vcards = list(chain.from_iterable(results))
+        _remember_etags(email, vcards)
+        contacts = await _parse_vcards_off_loop(vcards, search_blob=True)
+    
+    except Exception as e:
+        _forget_discovery(email, e)
+        raise ValueError(f"Failed to search contacts: {str(e)}")
     
-    # Filter by query
+    # Re-check locally: also covers addressbooks that were scanned unfiltered
     query_lower = query.lower()
-    filtered_contacts = [
-        contact for contact in contacts
-        if query_lower in contact.get("name", "").lower()
-        or any(query_lower in email.lower() for email in contact.get("emails", []))
-        or any(query_lower in phone.lower() for phone in contact.get("phones", []))
-    ]
+    filtered_contacts = []
+    for contact in contacts:
+        # Blobs are internal, so they are stripped from every contact here
+        if query_lower in contact.pop("_search_blob"):
+            filtered_contacts.append(contact)
     
     return filtered_contacts
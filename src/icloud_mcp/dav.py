@@ -0,0 +1,80 @@
+"""Shared WebDAV helpers for the CalDAV and CardDAV tools."""
+
+import hashlib
+import threading
+import requests
+from collections import OrderedDict
+from typing import Dict, Iterator, Tuple
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+
+# Maximum number of concurrent DAV requests issued by a single tool call
+MAX_CONCURRENT_REQUESTS = 8
+
+# Status codes meaning the server can't evaluate a query filter
+UNSUPPORTED_QUERY_STATUSES = (400, 501)
+
+# Parser options for multistatus bodies: no entity expansion, DTD loading
+# or network access, and no libxml2 size limits for very large collections
+XML_PARSE_OPTIONS = {"huge_tree": True, "resolve_entities": False, "no_network": True, "load_dtd": False}
+XML_PARSER = etree.XMLParser(**XML_PARSE_OPTIONS)
+
+# Clark-notation tags of a multistatus response
+TAG_RESPONSE = "{DAV:}response"
+TAG_HREF = "{DAV:}href"
+TAG_STATUS = "{DAV:}status"
+TAG_GETETAG = "{DAV:}getetag"
+
+
+def iter_responses(response: requests.Response) -> Iterator[etree._Element]:
+    """
+    Stream-parse a multistatus body and yield its response elements.
+
+    The response must be requested with stream=True; it is parsed as it
+    arrives from the socket and closed when iteration ends. Each element is
+    cleared, along with already-processed siblings still referenced by the
+    root, once the caller moves on, so only one is held in memory at a time.
+    """
+    with response:
+        response.raw.decode_content = True
+        for _, elem in etree.iterparse(response.raw, events=("end",), tag=TAG_RESPONSE, **XML_PARSE_OPTIONS):
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+
+def credentials_key(email: str, password: str) -> Tuple[str, str]:
+    """Build a cache key that doesn't keep the plain password around."""
+    return email, hashlib.sha256(password.encode("utf-8")).hexdigest()
+
+
+class SessionCache:
+    """Keep-alive HTTP sessions with Basic auth preloaded, per credential pair."""
+
+    def __init__(self, headers: Dict[str, str], pool_maxsize: int, max_size: int = 32):
+        self._headers = headers
+        self._pool_maxsize = pool_maxsize
+        self._max_size = max_size
+        self._sessions: "OrderedDict[Tuple[str, str], requests.Session]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, email: str, password: str) -> requests.Session:
+        """Get the pooled session for these credentials, dropping the least recently used past max_size."""
+        key = credentials_key(email, password)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                # Send credentials with the first request instead of after a 401 challenge
+                session.auth = HTTPBasicAuth(email, password)
+                session.headers.update(self._headers)
+                session.mount("https://", HTTPAdapter(
+                    pool_connections=4, pool_maxsize=self._pool_maxsize, max_retries=0
+                ))
+                self._sessions[key] = session
+            self._sessions.move_to_end(key)
+            while len(self._sessions) > self._max_size:
+                self._sessions.popitem(last=False)
+        return session
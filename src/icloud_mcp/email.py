@@ -14,7 +14,7 @@ from datetime import datetime
 from fastmcp import Context
 from imapclient import IMAPClient
 from .auth import require_auth
-from .config import config
+from .config import IMAP_PORT, IMAP_SERVER, SENT_FOLDER, SMTP_PORT, SMTP_SERVER
 
 # Configure minimal logging (only errors)
 logger = logging.getLogger(__name__)
@@ -30,7 +30,7 @@ logger.addHandler(stderr_handler)
 
 def _get_imap_client(username: str, password: str) -> IMAPClient:
     """Create IMAP client (stateless)."""
-    client = IMAPClient(config.IMAP_SERVER, port=config.IMAP_PORT, ssl=True, use_uid=True)
+    client = IMAPClient(IMAP_SERVER, port=IMAP_PORT, ssl=True, use_uid=True)
     client.login(username, password)
     return client
 
@@ -48,7 +48,7 @@ def _close_imap_client(client: IMAPClient) -> None:
 
 def _get_smtp_client(username: str, password: str) -> smtplib.SMTP:
     """Create SMTP client (stateless)."""
-    client = smtplib.SMTP(config.SMTP_SERVER, config.SMTP_PORT)
+    client = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
     client.starttls()
     client.login(username, password)
     return client
@@ -639,10 +639,10 @@ async def send_message(
 
         # Try to append to Sent folder
         try:
-            imap_client.append(config.SENT_FOLDER, msg_bytes, flags=['\\Seen'])
+            imap_client.append(SENT_FOLDER, msg_bytes, flags=['\\Seen'])
         except Exception as e:
             # If Sent Messages folder doesn't exist, try common alternatives
-            for folder_name in ['Sent', 'Sent Items', config.SENT_FOLDER]:
+            for folder_name in ['Sent', 'Sent Items', SENT_FOLDER]:
                 try:
                     imap_client.append(folder_name, msg_bytes, flags=['\\Seen'])
                     break
@@ -65,6 +65,29 @@ async def calendar_list_events(
         return {"error": str(e), "status": 500}
 
 
+@mcp.tool()
+async def calendar_get_freebusy(
+    context,
+    start_date: str,
+    end_date: str,
+    calendar_id: str = None
+) -> list | dict:
+    """
+    Get busy time periods (free/busy) without fetching full event details.
+
+    Args:
+        start_date: Start date in ISO format YYYY-MM-DD or datetime
+        end_date: End date in ISO format YYYY-MM-DD or datetime
+        calendar_id: Specific calendar URL/ID (optional)
+    """
+    try:
+        return await calendar.get_freebusy(context, start_date, end_date, calendar_id)
+    except AuthenticationError as e:
+        return {"error": str(e), "status": 401}
+    except Exception as e:
+        return {"error": str(e), "status": 500}
+
+
 @mcp.tool()
 async def calendar_create_event(
     context,
@@ -127,6 +150,23 @@ async def calendar_update_event(
         return {"error": str(e), "status": 500}
 
 
+@mcp.tool()
+async def calendar_update_events(context, updates: list[dict]) -> list | dict:
+    """
+    Update multiple calendar events at once (bulk update).
+
+    Args:
+        updates: List of updates, each with "event_id" and any of "summary", "start",
+            "end", "description", "location", "attendees"
+    """
+    try:
+        return await calendar.update_events_bulk(context, updates)
+    except AuthenticationError as e:
+        return {"error": str(e), "status": 401}
+    except Exception as e:
+        return {"error": str(e), "status": 500}
+
+
 @mcp.tool()
 async def calendar_delete_event(context, event_id: str) -> dict:
     """
@@ -204,6 +244,22 @@ async def contacts_get(context, contact_id: str) -> dict:
         return {"error": str(e), "status": 500}
 
 
+@mcp.tool()
+async def contacts_get_many(context, contact_ids: list[str]) -> list | dict:
+    """
+    Get several contacts by ID in one request per addressbook.
+
+    Args:
+        contact_ids: List of contact URLs/IDs
+    """
+    try:
+        return await contacts.get_contacts(context, contact_ids)
+    except AuthenticationError as e:
+        return {"error": str(e), "status": 401}
+    except Exception as e:
+        return {"error": str(e), "status": 500}
+
+
 @mcp.tool()
 async def contacts_create(
     context,
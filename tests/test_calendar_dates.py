@@ -0,0 +1,52 @@
+"""Date range parsing and windowing."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from icloud_mcp.calendar import _date_windows, _parse_date_range
+
+
+def _local(value: str) -> datetime:
+    return datetime.fromisoformat(value).astimezone().replace(tzinfo=None)
+
+
+def test_date_only_bounds_cover_whole_days():
+    start, end = _parse_date_range("2024-01-01", "2024-01-02")
+
+    assert start == datetime(2024, 1, 1)
+    assert end == datetime(2024, 1, 2, 23, 59, 59, 999999)
+
+
+@pytest.mark.parametrize("start_date, end_date", [
+    ("2024-01-01T09:00:00+02:00", None),
+    (None, "2024-06-01T09:00:00Z"),
+    ("2024-01-01T09:00:00Z", "2024-06-30"),
+    ("2024-01-01", "2024-06-30T18:00:00-05:00"),
+])
+def test_mixed_aware_and_naive_bounds(start_date, end_date):
+    start, end = _parse_date_range(start_date, end_date)
+
+    assert start.tzinfo is None and end.tzinfo is None
+    if start_date and "T" in start_date:
+        assert start == _local(start_date)
+    if end_date and "T" in end_date:
+        assert end == _local(end_date)
+    # Wide ranges are split into windows, which compares and subtracts the bounds
+    windows = _date_windows(start, end)
+    assert windows[0][0] == start and windows[-1][1] == end
+
+
+def test_aware_bounds_keep_their_instant():
+    start, _ = _parse_date_range("2024-01-01T09:00:00+02:00", "2024-01-02")
+
+    assert start.astimezone(timezone.utc) == datetime(2024, 1, 1, 7, tzinfo=timezone.utc)
+
+
+def test_wide_range_is_split_into_contiguous_windows():
+    start, end = datetime(2024, 1, 1), datetime(2024, 12, 31)
+    windows = _date_windows(start, end)
+
+    assert len(windows) > 1
+    assert all(window_end - window_start <= timedelta(days=30) for window_start, window_end in windows)
+    assert all(a[1] == b[0] for a, b in zip(windows, windows[1:]))
@@ -0,0 +1,115 @@
+"""Parity of the ICS line scanner with vobject parsing."""
+
+import pytest
+import vobject
+
+from icloud_mcp.calendar import _ics_datetime, _ics_text, _scan_vevents
+
+VTIMEZONE_BERLIN = (
+    "BEGIN:VTIMEZONE\r\n"
+    "TZID:Europe/Berlin\r\n"
+    "BEGIN:STANDARD\r\n"
+    "DTSTART:19701025T030000\r\n"
+    "RRULE:FREQ=YEARLY;BYMONTH=10;BYDAY=-1SU\r\n"
+    "TZOFFSETFROM:+0200\r\n"
+    "TZOFFSETTO:+0100\r\n"
+    "TZNAME:CET\r\n"
+    "END:STANDARD\r\n"
+    "BEGIN:DAYLIGHT\r\n"
+    "DTSTART:19700329T020000\r\n"
+    "RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=-1SU\r\n"
+    "TZOFFSETFROM:+0100\r\n"
+    "TZOFFSETTO:+0200\r\n"
+    "TZNAME:CEST\r\n"
+    "END:DAYLIGHT\r\n"
+    "END:VTIMEZONE\r\n"
+)
+
+
+def _calendar(vevent: str, vtimezone: str = "") -> str:
+    return (
+        "BEGIN:VCALENDAR\r\n"
+        "VERSION:2.0\r\n"
+        "PRODID:-//test//EN\r\n"
+        + vtimezone
+        + "BEGIN:VEVENT\r\n"
+        "UID:test-1\r\n"
+        "DTSTAMP:20240101T000000Z\r\n"
+        + vevent
+        + "END:VEVENT\r\n"
+        "END:VCALENDAR\r\n"
+    )
+
+
+def _vobject_iso(data: str, name: str) -> str:
+    return getattr(vobject.readOne(data).vevent, name).value.isoformat()
+
+
+@pytest.mark.parametrize("dtstart, dtend, vtimezone", [
+    ("DTSTART:20240115T090000Z\r\n", "DTEND:20240115T100000Z\r\n", ""),
+    ("DTSTART;VALUE=DATE:20240115\r\n", "DTEND;VALUE=DATE:20240116\r\n", ""),
+    (
+        "DTSTART;TZID=Europe/Berlin:20240715T090000\r\n",
+        "DTEND;TZID=\"Europe/Berlin\":20240715T103000\r\n",
+        VTIMEZONE_BERLIN,
+    ),
+    ("DTSTART:20240115T090000\r\n", "DTEND:20240115T100000\r\n", ""),
+])
+def test_datetimes_match_vobject(dtstart, dtend, vtimezone):
+    data = _calendar(dtstart + dtend + "SUMMARY:Meeting\r\n", vtimezone)
+    [props] = _scan_vevents(data)
+
+    assert _ics_datetime(props["DTSTART"]) == _vobject_iso(data, "dtstart")
+    assert _ics_datetime(props["DTEND"]) == _vobject_iso(data, "dtend")
+
+
+def test_folded_and_escaped_text_matches_vobject():
+    data = _calendar(
+        "DTSTART:20240115T090000Z\r\n"
+        "SUMMARY:Quarterly planning\\, budget\r\n"
+        "  review\r\n"
+        "DESCRIPTION:Line one\\nLine two\\; with\\\\backslash\r\n"
+        "\tand a tab fold\r\n"
+        "LOCATION;ALTREP=\"cid:room@example.com\":Room 4\\, Floor 2\r\n"
+    )
+    [props] = _scan_vevents(data)
+    vevent = vobject.readOne(data).vevent
+
+    assert _ics_text(props["SUMMARY"]) == vevent.summary.value
+    assert _ics_text(props["DESCRIPTION"]) == vevent.description.value
+    assert _ics_text(props["LOCATION"]) == vevent.location.value
+
+
+def test_nested_components_and_timezones_are_skipped():
+    data = _calendar(
+        "DTSTART;TZID=Europe/Berlin:20240115T090000\r\n"
+        "SUMMARY:Outer\r\n"
+        "BEGIN:VALARM\r\n"
+        "ACTION:DISPLAY\r\n"
+        "DESCRIPTION:Reminder\r\n"
+        "TRIGGER:-PT15M\r\n"
+        "END:VALARM\r\n"
+        "DESCRIPTION:Outer description\r\n",
+        VTIMEZONE_BERLIN,
+    )
+    [props] = _scan_vevents(data)
+    vevent = vobject.readOne(data).vevent
+
+    assert _ics_text(props["SUMMARY"]) == vevent.summary.value
+    assert _ics_text(props["DESCRIPTION"]) == vevent.description.value
+    assert _ics_datetime(props["DTSTART"]) == vevent.dtstart.value.isoformat()
+
+
+def test_every_vevent_is_scanned():
+    data = (
+        "BEGIN:VCALENDAR\r\n"
+        "BEGIN:VEVENT\r\nSUMMARY:First\r\nDTSTART:20240115T090000Z\r\nEND:VEVENT\r\n"
+        "BEGIN:VEVENT\r\nSUMMARY:Second\r\nDTSTART:20240116T090000Z\r\nEND:VEVENT\r\n"
+        "END:VCALENDAR\r\n"
+    )
+
+    assert [_ics_text(props["SUMMARY"]) for props in _scan_vevents(data)] == ["First", "Second"]
+
+
+def test_unknown_tzid_stays_floating():
+    assert _ics_datetime(("TZID=Not/AZone", "20240115T090000")) == "2024-01-15T09:00:00"
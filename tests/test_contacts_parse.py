@@ -0,0 +1,87 @@
+"""Parity of the vCard line scanner with vobject parsing."""
+
+import pytest
+import vobject
+
+from icloud_mcp.contacts import _extract_contact, _format_address
+
+
+def _card(*lines: str) -> str:
+    return "BEGIN:VCARD\r\nVERSION:3.0\r\n" + "".join(line + "\r\n" for line in lines) + "END:VCARD\r\n"
+
+
+def _vobject_contact(data: str, url: str) -> dict:
+    """List-view fields as they were built from a vobject tree."""
+    vcard = vobject.readOne(data)
+    return {
+        "id": url,
+        "name": str(vcard.fn.value) if hasattr(vcard, "fn") else "",
+        "phones": [str(tel.value) for tel in getattr(vcard, "tel_list", []) if tel.value],
+        "emails": [str(em.value) for em in getattr(vcard, "email_list", []) if em.value],
+        "addresses": [str(adr.value) for adr in getattr(vcard, "adr_list", []) if str(adr.value)],
+        "url": url,
+    }
+
+
+CARDS = {
+    "plain": _card(
+        "N:Doe;Jane;;;",
+        "FN:Jane Doe",
+        "TEL;TYPE=CELL:+1 555 0100",
+        "EMAIL;TYPE=INTERNET:jane@example.com",
+    ),
+    "group prefixes": _card(
+        "FN:Grouped",
+        "item1.EMAIL;type=INTERNET;type=pref:first@example.com",
+        "item1.X-ABLabel:_$!<Home>!$_",
+        "item2.TEL:+44 20 7946 0000",
+        "item3.ADR;type=HOME:;;1 Main St;Springfield;IL;62701;USA",
+    ),
+    "quoted params": _card(
+        'FN:Quoted',
+        'TEL;TYPE="cell,voice";X-NOTE="a:b;c":+1 555 0101',
+        'EMAIL;X-LABEL="work: main":quoted@example.com',
+    ),
+    "folded lines": _card(
+        "FN:A very long name that the server folded onto",
+        "  a continuation line",
+        "EMAIL:folded@exam",
+        "\tple.com",
+    ),
+    "escapes": _card(
+        "FN:Smith\\, John\\; Jr.",
+        "ADR:;;12 High St\\, Flat 3;London;;SW1A 1AA;UK",
+    ),
+    "address lists": _card(
+        "FN:Lists",
+        "ADR:PO Box 1;Suite 2;Line one,Line two;New,York;NY;10001;United States",
+        "ADR:;;;;;;",
+        "ADR:;;Only Street",
+    ),
+    "repeated FN": _card(
+        "FN:First",
+        "FN:Second",
+    ),
+}
+
+
+@pytest.mark.parametrize("name", sorted(CARDS))
+def test_extract_contact_matches_vobject(name):
+    url = "https://contacts.icloud.com/1/carddavhome/card/abc.vcf"
+    data = CARDS[name]
+
+    assert _extract_contact({"url": url, "data": data}) == _vobject_contact(data, url)
+
+
+@pytest.mark.parametrize("value", [
+    ";;1 Main St;Springfield;IL;62701;USA",
+    "PO Box 1;Suite 2;Line one,Line two;New,York;NY;10001;United States",
+    ";;12 High St\\, Flat 3\\nRear entrance;London;;SW1A 1AA;UK",
+    ";;;;;;",
+    ";;Only Street",
+    "",
+])
+def test_format_address_matches_vobject(value):
+    adr = vobject.readOne(_card("FN:x", f"ADR:{value}")).adr
+
+    assert _format_address(value) == str(adr.value)
@@ -0,0 +1,72 @@
+"""Parity of the textual FN/ORG/TITLE rewrite with a vobject round trip."""
+
+import pytest
+import vobject
+
+from icloud_mcp.contacts import _patch_vcard_scalars, _update_vcard
+
+CARD = (
+    "BEGIN:VCARD\r\n"
+    "VERSION:3.0\r\n"
+    "N:Doe;Jane;;;\r\n"
+    "FN:Jane Doe\r\n"
+    "item1.ORG;CHARSET=utf-8:Old Corp;Sales\r\n"
+    "TITLE;LANGUAGE=\"en\":Clerk with a long title that the server\r\n"
+    "  folded onto a second line\r\n"
+    "item2.EMAIL;type=INTERNET:jane@example.com\r\n"
+    "item2.X-ABLabel:_$!<Work>!$_\r\n"
+    "TEL;TYPE=CELL:+1 555 0100\r\n"
+    "END:VCARD\r\n"
+)
+
+BARE_CARD = "BEGIN:VCARD\nVERSION:3.0\nN:Doe;Jane;;;\nFN:Jane Doe\nEND:VCARD\n"
+
+
+def _fields(data: bytes) -> dict:
+    vcard = vobject.readOne(data.decode("utf-8"))
+    contents = vcard.contents
+    return {
+        "fn": [line.value for line in contents.get("fn", [])],
+        "org": [line.value for line in contents.get("org", [])],
+        "title": [line.value for line in contents.get("title", [])],
+        "email": [line.value for line in contents.get("email", [])],
+        "tel": [line.value for line in contents.get("tel", [])],
+    }
+
+
+@pytest.mark.parametrize("card", [CARD, BARE_CARD], ids=["full", "missing lines"])
+@pytest.mark.parametrize("name, organization, title", [
+    ("John Smith", None, None),
+    (None, "New Corp", None),
+    (None, None, "Manager"),
+    ("Smith, John; Jr.", "Acme; Widgets, Inc.", "VP\\Ops\nEMEA"),
+    ("", "", ""),
+])
+def test_patch_matches_vobject_update(card, name, organization, title):
+    patched = _patch_vcard_scalars(card, name, organization, title)
+    expected = _update_vcard(card, name, None, None, None, organization, title)
+
+    assert patched is not None
+    assert _fields(patched[0]) == _fields(expected[0])
+    assert patched[1] == expected[1]
+
+
+def test_patch_keeps_group_prefix_and_parameters():
+    data, _ = _patch_vcard_scalars(CARD, None, "New Corp", "Manager")
+    text = data.decode("utf-8")
+
+    assert "item1.ORG;CHARSET=utf-8:New Corp\r\n" in text
+    assert 'TITLE;LANGUAGE="en":Manager\r\n' in text
+    # The folded continuation of the old title is replaced too
+    assert "folded onto" not in text
+
+
+def test_patch_adds_missing_lines_before_end():
+    data, full_name = _patch_vcard_scalars(BARE_CARD, None, "Acme", "Engineer")
+
+    assert data.decode("utf-8").endswith("ORG:Acme\nTITLE:Engineer\nEND:VCARD\n")
+    assert full_name == "Jane Doe"
+
+
+def test_incomplete_vcard_is_left_to_vobject():
+    assert _patch_vcard_scalars("BEGIN:VCARD\r\nFN:Cut off", "Name", None, None) is None